@@ -11,28 +11,76 @@ import os
 from datetime import datetime
 import urllib.parse
 import random
+import re
 import logging
+import weakref
+from memory_watchdog import MemoryWatchdog
+from search_planner import plan_searches, dedupe_postings, result_pages
+from search_scheduler import SearchScheduler
+from job_prefetch import JobPrefetcher
+from timeout_policy import TimeoutPolicy
+from job_cache import JobDetailsCache
+from settings import (MAX_APPLICATIONS, DELAY_BETWEEN_APPLICATIONS, SEARCH_STATS_FILE, WAIT_TIMEOUTS,
+                      TIMEOUT_PROFILE_FILE, JOB_CACHE_FILE, JOB_CACHE_TTL_HOURS, JOB_CACHE_MAX_ENTRIES,
+                      configure_logging, load_config, configured_searches, application_limit)
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("linkedin_automation.log"),
-        logging.StreamHandler()
-    ]
-)
 logger = logging.getLogger()
 
-# Configuration
-LINKEDIN_EMAIL = "example@gmail.com"  # Replace with your LinkedIn email
-LINKEDIN_PASSWORD = "password"  # Replace with your LinkedIn password
+# Configuration (credentials, searches and pacing are replaced from config.json by configure())
+LINKEDIN_EMAIL = "your_email@example.com"  # Set linkedin_credentials in config.json
+LINKEDIN_PASSWORD = "your_password"
 SCREENSHOT_DIR = "screenshots"
-MAX_APPLICATIONS = 3  # Maximum number of applications per search
+JOB_SEARCHES = configured_searches({})
 WAIT_TIME_BETWEEN_ACTIONS = (2, 5)  # Random wait time range between actions in seconds
+DRIVER_BACKEND = os.environ.get("LINKEDIN_DRIVER_BACKEND", "selenium")  # "selenium" or "cdp" (DevTools over asyncio)
+CHROME_ARGUMENTS = [
+    "--window-size=1920,1080",
+    "--disable-notifications",
+    "--disable-popup-blocking",
+    "--disable-extensions",
+    "--disable-gpu",
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/135.0.7049.86 Safari/537.36"
+]
+DISCOVERY_MODE = os.environ.get("LINKEDIN_DISCOVERY_MODE", "browser")  # "browser" or "http" (browserless search)
+JOB_VIEW_URL = "https://www.linkedin.com/jobs/view/{job_id}/"
+SEARCH_RESULTS_PER_PAGE = 25  # Job cards per search results page (the step of the start= parameter)
+PREFETCH_JOB_DETAILS = True  # Load the next job's details in the background while applying
+PREFETCH_TAKE_TIMEOUT = 3  # Seconds to wait for an unfinished prefetch before loading details directly
+JOB_DETAILS_LOCATORS = [
+    (By.CSS_SELECTOR, ".jobs-unified-top-card"),
+    (By.CSS_SELECTOR, ".jobs-details"),
+    (By.CSS_SELECTOR, ".jobs-box__html-content")
+]
+JOB_CARD_SELECTORS = [".job-card-container", ".jobs-search-results__list-item", ".jobs-search-result-item"]
+JOB_TOP_CARD_LOCATORS = [  # Rendered with the apply button, unlike the bare details container
+    (By.CSS_SELECTOR, ".jobs-unified-top-card"),
+    (By.CSS_SELECTOR, ".jobs-details-top-card"),
+    (By.CSS_SELECTOR, ".jobs-apply-button")
+]
+JOB_DETAIL_SELECTORS = {
+    "title": [".jobs-unified-top-card__job-title", ".jobs-details-top-card__job-title"],
+    "company": [".jobs-unified-top-card__company-name", ".jobs-details-top-card__company-info"],
+    "location": [".jobs-unified-top-card__bullet", ".jobs-details-top-card__bullet"],
+    "description": [".jobs-box__html-content", ".jobs-description-content__text"]
+}
+MEMORY_LIMITS_MB = {"renderer_rss_mb": 1024, "js_heap_used_mb": 512, "browser_rss_mb": 2048}  # Recycle thresholds
+MEMORY_SAMPLES_FILE = "memory_samples.jsonl"  # Memory samples recorded alongside the session log
+
+timeout_policy = TimeoutPolicy(WAIT_TIMEOUTS)
+page_load_timeouts = weakref.WeakKeyDictionary()  # Page load timeout last set on each driver
+job_cache = JobDetailsCache(JOB_CACHE_TTL_HOURS * 3600, JOB_CACHE_MAX_ENTRIES)
 
-# Create screenshots directory if it doesn't exist
-os.makedirs(SCREENSHOT_DIR, exist_ok=True)
+def configure(config):
+    """Take credentials, searches and pacing from config.json in place of the defaults"""
+    global LINKEDIN_EMAIL, LINKEDIN_PASSWORD, JOB_SEARCHES, DELAY_BETWEEN_APPLICATIONS
+    credentials = config.get("linkedin_credentials", {})
+    LINKEDIN_EMAIL = credentials.get("email") or LINKEDIN_EMAIL
+    LINKEDIN_PASSWORD = credentials.get("password") or LINKEDIN_PASSWORD
+    JOB_SEARCHES = configured_searches(config)
+    if config.get("delay_between_applications"):
+        DELAY_BETWEEN_APPLICATIONS = tuple(config["delay_between_applications"])
 
 def random_wait():
     """Wait for a random time within the specified range"""
@@ -44,6 +92,7 @@ def take_screenshot(driver, prefix):
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     filename = f"{SCREENSHOT_DIR}/{prefix}_{timestamp}.png"
     try:
+        os.makedirs(SCREENSHOT_DIR, exist_ok=True)
         driver.save_screenshot(filename)
         logger.info(f"Saved screenshot: {filename}")
         return filename
@@ -51,40 +100,96 @@ def take_screenshot(driver, prefix):
         logger.error(f"Failed to take screenshot: {str(e)}")
         return None
 
-def setup_driver():
-    """Set up and return a configured Chrome WebDriver with enhanced options"""
+def count_stat(stats, field):
+    """Increment a per-search counter if the caller is collecting them"""
+    if stats is not None:
+        stats[field] = stats.get(field, 0) + 1
+
+def setup_driver(backend=None, headless=False):
+    """Set up and return a configured Chrome driver for the selected backend"""
+    backend = backend or DRIVER_BACKEND
     try:
-        chrome_options = Options()
-        chrome_options.add_argument("--window-size=1920,1080")
-        chrome_options.add_argument("--disable-notifications")
-        chrome_options.add_argument("--disable-popup-blocking")
-        chrome_options.add_argument("--disable-extensions")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/135.0.7049.86 Safari/537.36")
-        
-        # Initialize Chrome driver
-        driver = webdriver.Chrome(options=chrome_options)
+        if backend == "cdp":
+            # Imported lazily so the websockets dependency is only needed for this backend
+            from cdp_driver import CDPDriver
+            driver = CDPDriver(headless=headless, arguments=CHROME_ARGUMENTS)
+        elif backend == "selenium":
+            chrome_options = Options()
+            for argument in CHROME_ARGUMENTS:
+                chrome_options.add_argument(argument)
+            if headless:
+                chrome_options.add_argument("--headless=new")
+            
+            # Initialize Chrome driver
+            driver = webdriver.Chrome(options=chrome_options)
+        else:
+            raise ValueError(f"Unknown driver backend: {backend}")
+        
         driver.maximize_window()
-        driver.set_page_load_timeout(30)
+        apply_page_load_timeout(driver, timeout_policy.timeout("page_load"))
         
-        logger.info("WebDriver initialized successfully")
+        logger.info(f"WebDriver initialized successfully ({backend} backend)")
         return driver
     except Exception as e:
         logger.error(f"Failed to initialize WebDriver: {str(e)}")
         raise
 
+def wait_for_presence(driver, locators, timeout=None, name=None):
+    """Wait until any of the (By, selector) locators is present, raising TimeoutException otherwise.
+    Named waits use the learned timeout unless one is given, and record how long they took."""
+    if timeout is None:
+        timeout = timeout_policy.timeout(name)
+    start = time.monotonic()
+    try:
+        if hasattr(driver, "wait_for"):
+            # The CDP backend resolves waits from DOM mutation events instead of polling
+            result = driver.wait_for(locators, timeout)
+        else:
+            result = WebDriverWait(driver, timeout).until(
+                EC.any_of(*[EC.presence_of_element_located(locator) for locator in locators])
+            )
+    except TimeoutException:
+        if name:
+            timeout_policy.record_timeout(name, time.monotonic() - start)
+        raise
+    if name:
+        timeout_policy.record(name, time.monotonic() - start)
+    return result
+
+def apply_page_load_timeout(driver, timeout):
+    """Set the driver's page load timeout unless it is already in effect (tabs use their driver's)"""
+    if page_load_timeouts.get(driver) != timeout and hasattr(driver, "set_page_load_timeout"):
+        driver.set_page_load_timeout(timeout)
+        page_load_timeouts[driver] = timeout
+
+def open_page(driver, url):
+    """Navigate to a URL with the learned page load timeout, recording the load time it is learned from.
+    A load that runs out of a learned timeout shorter than the configured one is retried once with that."""
+    timeout = timeout_policy.timeout("page_load")
+    for retry in (False, True):
+        apply_page_load_timeout(driver, timeout)
+        start = time.monotonic()
+        try:
+            driver.get(url)
+        except TimeoutException:
+            timeout_policy.record_timeout("page_load", time.monotonic() - start)
+            configured = timeout_policy.configured_timeout("page_load")
+            if retry or timeout >= configured:
+                raise
+            logger.warning(f"Page load timed out after {timeout}s, retrying with the configured {configured}s")
+            timeout = configured
+            continue
+        timeout_policy.record("page_load", time.monotonic() - start)
+        return
+
 def login_to_linkedin(driver):
     """Log in to LinkedIn account with enhanced error handling"""
     try:
         logger.info("Navigating to LinkedIn login page")
-        driver.get("https://www.linkedin.com/login")
+        open_page(driver, "https://www.linkedin.com/login")
         
         # Wait for login page to load
-        WebDriverWait(driver, 15).until(
-            EC.presence_of_element_located((By.ID, "username"))
-        )
+        wait_for_presence(driver, [(By.ID, "username")], name="login_form")
         
         # Enter credentials with random delays to mimic human behavior
         username_field = driver.find_element(By.ID, "username")
@@ -109,13 +214,11 @@ def login_to_linkedin(driver):
         
         # Wait for login to complete with multiple possible success indicators
         try:
-            WebDriverWait(driver, 25).until(
-                EC.any_of(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, ".global-nav")),
-                    EC.presence_of_element_located((By.CSS_SELECTOR, ".authentication-outlet")),
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "[data-test-global-nav]"))
-                )
-            )
+            wait_for_presence(driver, [
+                (By.CSS_SELECTOR, ".global-nav"),
+                (By.CSS_SELECTOR, ".authentication-outlet"),
+                (By.CSS_SELECTOR, "[data-test-global-nav]")
+            ], name="login_success")
             logger.info("Successfully logged in to LinkedIn")
             
             # Check for security verification
@@ -142,8 +245,8 @@ def login_to_linkedin(driver):
         take_screenshot(driver, "login_error")
         return False
 
-def search_jobs_directly(driver, keywords, location):
-    """Search for jobs with improved error handling and verification"""
+def search_jobs_directly(driver, keywords, location, start=0):
+    """Search for jobs with improved error handling and verification, from result `start` on"""
     try:
         logger.info(f"Searching for '{keywords}' jobs in '{location}' using direct URL")
         
@@ -154,11 +257,9 @@ def search_jobs_directly(driver, keywords, location):
         # Navigate directly to search results with filters
         # Use f_AL=true for Easy Apply filter
         search_url = f"https://www.linkedin.com/jobs/search/?keywords={encoded_keywords}&location={encoded_location}&f_AL=true"
-        driver.get(search_url)
-        
-        # Wait for page to load with better timeout handling
-        random_wait()
-        take_screenshot(driver, f"search_initial_{encoded_keywords}_{encoded_location}")
+        if start:
+            search_url += f"&start={start}"
+        open_page(driver, search_url)
         
         # Use a comprehensive approach to verify search results loaded
         search_result_selectors = [
@@ -169,33 +270,30 @@ def search_jobs_directly(driver, keywords, location):
             ".jobs-search__job-details"
         ]
         
-        # Try multiple selectors to check if search results loaded
+        # Wait for any of the selectors at once, so a missing one does not cost a timeout of its own.
+        # The named waits run straight after navigation, so what they learn is page latency, not our pauses.
         search_loaded = False
-        for selector in search_result_selectors:
-            try:
-                WebDriverWait(driver, 10).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                )
-                logger.info(f"Search results loaded successfully (detected with selector: {selector})")
-                search_loaded = True
-                break
-            except TimeoutException:
-                continue
+        try:
+            wait_for_presence(driver, [(By.CSS_SELECTOR, selector) for selector in search_result_selectors],
+                              name="search_results")
+            logger.info("Search results loaded successfully")
+            search_loaded = True
+        except TimeoutException:
+            pass
         
         if search_loaded:
             # Check if we have actual job listings
             try:
-                # Wait a bit more for the actual job cards to load
-                time.sleep(3)
-                
-                # Check for multiple possible job card selectors
-                job_card_selectors = [
-                    ".job-card-container",
-                    ".jobs-search-results__list-item",
-                    ".jobs-search-result-item"
-                ]
+                # Wait for the actual job cards to load
+                try:
+                    wait_for_presence(driver, [(By.CSS_SELECTOR, selector) for selector in JOB_CARD_SELECTORS],
+                                      name="job_cards")
+                except TimeoutException:
+                    pass
+                random_wait()
+                take_screenshot(driver, f"search_initial_{encoded_keywords}_{encoded_location}")
                 
-                for selector in job_card_selectors:
+                for selector in JOB_CARD_SELECTORS:
                     job_cards = driver.find_elements(By.CSS_SELECTOR, selector)
                     if job_cards:
                         logger.info(f"Found {len(job_cards)} job cards with selector: {selector}")
@@ -217,7 +315,7 @@ def search_jobs_directly(driver, keywords, location):
                 time.sleep(3)
                 
                 # Check again after scrolling
-                for selector in job_card_selectors:
+                for selector in JOB_CARD_SELECTORS:
                     job_cards = driver.find_elements(By.CSS_SELECTOR, selector)
                     if job_cards:
                         logger.info(f"Found {len(job_cards)} job cards after scrolling")
@@ -245,26 +343,19 @@ def get_job_listings(driver):
     try:
         logger.info("Finding job listings")
         
-        # Define multiple possible selectors for job cards
-        job_card_selectors = [
-            ".job-card-container", 
-            ".jobs-search-results__list-item",
-            ".jobs-search-result-item"
-        ]
-        
-        # Try each selector
+        # Wait for any of the selectors at once, then take the cards from the first one that matches.
+        # Unnamed: callers reach this after pauses of their own, which would skew the learned job_cards timeout
         job_cards = []
-        for selector in job_card_selectors:
-            try:
-                WebDriverWait(driver, 10).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                )
+        try:
+            wait_for_presence(driver, [(By.CSS_SELECTOR, selector) for selector in JOB_CARD_SELECTORS],
+                              timeout_policy.timeout("job_cards"))
+            for selector in JOB_CARD_SELECTORS:
                 job_cards = driver.find_elements(By.CSS_SELECTOR, selector)
                 if job_cards:
                     logger.info(f"Found {len(job_cards)} job cards with selector: {selector}")
                     break
-            except TimeoutException:
-                continue
+        except TimeoutException:
+            pass
         
         if not job_cards:
             logger.warning("Could not find job cards with any selector")
@@ -282,38 +373,46 @@ def get_job_listings(driver):
         return []
 
 def check_easy_apply(driver):
-    """Check if the current job has Easy Apply option"""
+    """Check if the current job has Easy Apply option; None if the check failed and cannot tell"""
+    # Try different selectors for Easy Apply button (button text is matched by the XPath below)
+    easy_apply_selectors = [
+        ".jobs-apply-button",
+        "button[data-control-name='jobdetails_topcard_inapply']",
+        "button[aria-label='Easy Apply']"
+    ]
+    
+    check_failed = False
+    for selector in easy_apply_selectors:
+        try:
+            elements = driver.find_elements(By.CSS_SELECTOR, selector)
+            if elements and any(element.is_displayed() for element in elements):
+                return True
+        except Exception as e:
+            logger.warning(f"Easy Apply check failed with selector {selector}: {str(e)}")
+            check_failed = True
+    
+    # Check if "Apply" text is in any button
     try:
-        # Try different selectors for Easy Apply button
-        easy_apply_selectors = [
-            ".jobs-apply-button",
-            "button[data-control-name='jobdetails_topcard_inapply']",
-            "button[aria-label='Easy Apply']",
-            "button span:contains('Easy Apply')"
-        ]
-        
-        for selector in easy_apply_selectors:
-            try:
-                elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                if elements and any(element.is_displayed() for element in elements):
-                    return True
-            except:
-                continue
-                
-        # Check if "Apply" text is in any button
         apply_buttons = driver.find_elements(By.XPATH, "//button[contains(., 'Apply') or contains(., 'Easy Apply')]")
         if apply_buttons and any(button.is_displayed() for button in apply_buttons):
             return True
-            
-        return False
-    except:
-        return False
+    except Exception as e:
+        logger.warning(f"Easy Apply check failed on button text: {str(e)}")
+        check_failed = True
+    
+    # Only a check that ran to the end may conclude there is no Easy Apply option
+    return None if check_failed else False
 
-def apply_to_job(driver, job_card, index):
+def apply_to_job(driver, job_card, index, details=None, stats=None, job_id=None):
     """Apply to a job with improved error handling"""
     try:
         logger.info(f"Attempting to apply to job #{index+1}")
         
+        # A prefetch that already found no Easy Apply option saves opening the job at all
+        if details and details.get("easy_apply") is False:
+            logger.info("No Easy Apply option for this job (prefetched), skipping")
+            return False
+        
         # Try clicking the job card with retry mechanism
         max_retries = 3
         for attempt in range(max_retries):
@@ -331,61 +430,91 @@ def apply_to_job(driver, job_card, index):
                     logger.error(f"Failed to click job card after {max_retries} attempts")
                     return False
         
+        return apply_from_job_details(driver, index, details, stats, job_id)
+            
+    except Exception as e:
+        logger.error(f"Error applying to job: {str(e)}")
+        take_screenshot(driver, f"apply_error_{index}")
+        return False
+
+def apply_to_job_id(driver, job_id, index, details=None, stats=None, raise_errors=False):
+    """Open a job's own page by ID and apply to it. With `raise_errors`, errors (including a page that
+    did not load) are raised instead of being returned as False, so a caller can retry the job."""
+    try:
+        logger.info(f"Attempting to apply to job #{index+1} (job ID {job_id})")
+        
+        # A prefetch that already found no Easy Apply option saves loading the page at all
+        if details and details.get("easy_apply") is False:
+            logger.info("No Easy Apply option for this job (prefetched), skipping")
+            return False
+        
+        open_page(driver, JOB_VIEW_URL.format(job_id=job_id))
+        random_wait()
+        return apply_from_job_details(driver, index, details, stats, job_id, raise_errors)
+            
+    except Exception as e:
+        logger.error(f"Error applying to job: {str(e)}")
+        take_screenshot(driver, f"apply_error_{index}")
+        if raise_errors:
+            raise
+        return False
+
+def extract_job_details(driver):
+    """Read title, company, location, description and Easy Apply availability from a job details view"""
+    details = {key: None for key in JOB_DETAIL_SELECTORS}
+    try:
+        for key, selectors in JOB_DETAIL_SELECTORS.items():
+            for selector in selectors:
+                elements = driver.find_elements(By.CSS_SELECTOR, selector)
+                if elements:
+                    details[key] = elements[0].text
+                    break
+    except Exception as e:
+        logger.warning(f"Error extracting job details: {str(e)}")
+    details["easy_apply"] = check_easy_apply(driver)
+    return details
+
+def apply_from_job_details(driver, index, details=None, stats=None, job_id=None, raise_errors=False):
+    """Apply to the job whose details are currently displayed, reusing prefetched or cached details if given"""
+    try:
         # Wait for job details to load with multiple possible selectors
         try:
-            WebDriverWait(driver, 10).until(
-                EC.any_of(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, ".jobs-unified-top-card")),
-                    EC.presence_of_element_located((By.CSS_SELECTOR, ".jobs-details")),
-                    EC.presence_of_element_located((By.CSS_SELECTOR, ".jobs-box__html-content"))
-                )
-            )
+            wait_for_presence(driver, JOB_DETAILS_LOCATORS, name="job_details")
         except TimeoutException:
             logger.error("Job details did not load")
             take_screenshot(driver, f"job_details_timeout_{index}")
+            if raise_errors:
+                raise
             return False
         
         # Take screenshot of job details
         random_wait()
         take_screenshot(driver, f"job_details_{index}")
         
-        # Get job title and company if available
-        try:
-            job_title_selectors = [
-                ".jobs-unified-top-card__job-title",
-                ".jobs-details-top-card__job-title"
-            ]
-            
-            company_selectors = [
-                ".jobs-unified-top-card__company-name",
-                ".jobs-details-top-card__company-info"
-            ]
-            
-            job_title = None
-            for selector in job_title_selectors:
-                elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                if elements:
-                    job_title = elements[0].text
-                    break
-                    
-            company = None
-            for selector in company_selectors:
-                elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                if elements:
-                    company = elements[0].text
-                    break
-            
-            if job_title and company:
-                logger.info(f"Selected job: {job_title} at {company}")
-            else:
-                logger.warning("Could not extract complete job details")
-        except Exception as e:
-            logger.warning(f"Error extracting job details: {str(e)}")
+        # Get job title, company and Easy Apply availability unless they were prefetched
+        if details is None:
+            details = extract_job_details(driver)
+            job_cache.put(job_id, details)
         
-        # Check if Easy Apply button exists
-        if not check_easy_apply(driver):
+        if details["title"] and details["company"]:
+            logger.info(f"Selected job: {details['title']} at {details['company']}")
+        else:
+            logger.warning("Could not extract complete job details")
+        
+        # Check if Easy Apply button exists (prefetches over HTTP cannot always tell)
+        easy_apply = details.get("easy_apply")
+        if easy_apply is None:
+            easy_apply = check_easy_apply(driver)
+            if easy_apply is not None:
+                job_cache.put(job_id, {"easy_apply": easy_apply})
+        if easy_apply is None:
+            # Not cached, so a later search checks this job again
+            logger.warning("Could not tell whether this job has an Easy Apply option, skipping")
+            return False
+        if not easy_apply:
             logger.info("No Easy Apply option for this job, skipping")
             return False
+        count_stat(stats, "easy_apply")
             
         # Find and click Easy Apply button
         apply_button_found = False
@@ -434,13 +563,11 @@ def apply_to_job(driver, job_card, index):
         
         # Wait for application form
         try:
-            WebDriverWait(driver, 10).until(
-                EC.any_of(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, ".jobs-easy-apply-content")),
-                    EC.presence_of_element_located((By.CSS_SELECTOR, ".jobs-apply-form")),
-                    EC.presence_of_element_located((By.CSS_SELECTOR, ".artdeco-modal-overlay"))
-                )
-            )
+            wait_for_presence(driver, [
+                (By.CSS_SELECTOR, ".jobs-easy-apply-content"),
+                (By.CSS_SELECTOR, ".jobs-apply-form"),
+                (By.CSS_SELECTOR, ".artdeco-modal-overlay")
+            ], name="application_form")
             logger.info("Application form loaded")
             take_screenshot(driver, f"application_form_{index}")
             
@@ -453,6 +580,8 @@ def apply_to_job(driver, job_card, index):
             return False
             
     except Exception as e:
+        if raise_errors:
+            raise
         logger.error(f"Error applying to job: {str(e)}")
         take_screenshot(driver, f"apply_error_{index}")
         return False
@@ -797,11 +926,84 @@ def complete_application(driver, index):
             
         return False
 
-def handle_job_search(driver, search):
-    """Handle a complete job search and application process"""
+def get_job_id(job_card):
+    """Return the LinkedIn job ID of a job card, or None if it cannot be found"""
+    try:
+        for attribute in ["data-job-id", "data-occludable-job-id"]:
+            job_id = job_card.get_attribute(attribute)
+            if job_id:
+                return job_id
+        
+        # Fall back to the ID in the card's link to the job page
+        for link in job_card.find_elements(By.CSS_SELECTOR, "a[href*='/jobs/view/']"):
+            match = re.search(r"/jobs/view/(?:[^/?]*-)?(\d+)", link.get_attribute("href") or "")
+            if match:
+                return match.group(1)
+    except Exception as e:
+        logger.debug(f"Could not read job ID from card: {str(e)}")
+    return None
+
+def create_prefetcher(driver, discovery_session=None):
+    """Prefetch job details in a background tab (CDP backend) or over HTTP; None if prefetching is off"""
+    if not PREFETCH_JOB_DETAILS:
+        return None
+    
+    if hasattr(driver, "new_tab"):
+        # CDP tabs share one websocket and can be driven while the main tab fills in a form
+        tab = driver.new_tab()
+        
+        def fetch_in_tab(job_id, cancelled):
+            open_page(tab, JOB_VIEW_URL.format(job_id=job_id))
+            if cancelled.is_set():
+                return None
+            wait_for_presence(tab, JOB_TOP_CARD_LOCATORS, name="job_details")
+            if cancelled.is_set():
+                return None
+            details = extract_job_details(tab)
+            if not details["easy_apply"]:
+                # Only a button that was found counts; a missing one is checked again before applying
+                details["easy_apply"] = None
+            return details
+        
+        logger.info("Prefetching job details in a background tab")
+        return JobPrefetcher(job_cache.cached_fetch(fetch_in_tab), close=lambda: driver.close_tab(tab))
+    
+    # Selenium can only drive one tab at a time, so prefetch over HTTP instead
+    from http_discovery import DiscoverySession, fetch_job_details
+    session = discovery_session
+    if session is None:
+        # Searches run in the browser, so open a client of our own with the browser's cookies
+        try:
+            session = DiscoverySession.from_driver(driver)
+        except Exception as e:
+            logger.warning(f"Prefetching job details is off, could not share the browser's cookies: {str(e)}")
+            return None
+    logger.info("Prefetching job details over HTTP")
+    return JobPrefetcher(job_cache.cached_fetch(lambda job_id, cancelled: fetch_job_details(session, job_id)),
+                         close=session.close if session is not discovery_session else None)
+
+def next_unseen_job_id(job_cards, start, seen_job_ids):
+    """Return the job ID of the first card from `start` on that has not been seen yet"""
+    for job_card in job_cards[start:]:
+        job_id = get_job_id(job_card)
+        if job_id and job_id not in seen_job_ids:
+            return job_id
+    return None
+
+def handle_job_search(driver, search, watchdog=None, discovery_session=None, seen_job_ids=None,
+                      max_applications=MAX_APPLICATIONS, prefetcher=None, stats=None):
+    """Handle a complete job search and application process, counting postings and outcomes into `stats`"""
     try:
         logger.info(f"Starting search for {search['keywords']} in {search['location']}")
         
+        # Job IDs already attempted in earlier searches of this session
+        if seen_job_ids is None:
+            seen_job_ids = set()
+        
+        if discovery_session:
+            return handle_job_search_http(driver, discovery_session, search, watchdog, seen_job_ids, max_applications,
+                                          prefetcher, stats)
+        
         # Search for jobs
         if not search_jobs_directly(driver, search["keywords"], search["location"]):
             logger.warning("Skipping search due to error")
@@ -812,28 +1014,80 @@ def handle_job_search(driver, search):
         if not job_cards:
             logger.warning("No job listings found")
             return 0
+        if stats is not None:
+            stats["postings_found"] = len(job_cards)
         
         applied_count = 0
-        # Apply to jobs (limit to MAX_APPLICATIONS per search)
-        jobs_to_apply = min(len(job_cards), MAX_APPLICATIONS)
-        
-        for i in range(jobs_to_apply):
+        attempts = 0
+        card_index = 0
+        page = 0
+        pages = result_pages(search)
+        # Apply to jobs (limit to max_applications per search), skipping jobs seen in earlier searches
+        while attempts < max_applications:
+            if card_index >= len(job_cards):
+                # A merged search reads on, one page per search it covers
+                page += 1
+                if page >= pages:
+                    break
+                if not search_jobs_directly(driver, search["keywords"], search["location"],
+                                            page * SEARCH_RESULTS_PER_PAGE):
+                    break
+                job_cards = get_job_listings(driver)
+                card_index = 0
+                if not job_cards:
+                    break
+                if stats is not None:
+                    stats["postings_found"] += len(job_cards)
+                continue
+            i = attempts
             try:
-                logger.info(f"\nAttempting job application {i+1}/{jobs_to_apply}")
-                if apply_to_job(driver, job_cards[i], i):
+                job_card = job_cards[card_index]
+                card_index += 1
+                job_id = get_job_id(job_card)
+                if job_id in seen_job_ids:
+                    logger.info(f"Skipping job {job_id}, already seen in an earlier search")
+                    if prefetcher:
+                        prefetcher.cancel(job_id)
+                    continue
+                if job_id:
+                    seen_job_ids.add(job_id)
+                
+                # Details cached by an earlier search or session can rule a job out without opening it
+                cached_details = job_cache.get(job_id)
+                if cached_details and cached_details["easy_apply"] is False:
+                    logger.info(f"Skipping job {job_id}, cached details show no Easy Apply option")
+                    if prefetcher:
+                        prefetcher.cancel(job_id)
+                    continue
+                
+                attempts += 1
+                count_stat(stats, "attempted")
+                logger.info(f"\nAttempting job application {attempts}/{max_applications}")
+                
+                # Hand over this job's prefetched details and start on the next candidate
+                details = None
+                if prefetcher:
+                    details = prefetcher.take(job_id, PREFETCH_TAKE_TIMEOUT)
+                    if attempts < max_applications:
+                        prefetcher.prefetch(next_unseen_job_id(job_cards, card_index, seen_job_ids))
+                
+                if apply_to_job(driver, job_card, i, details or cached_details, stats, job_id):
                     applied_count += 1
+                    count_stat(stats, "applied")
                 
                 # Random wait between applications
-                wait_time = random.uniform(5, 8)
+                wait_time = random.uniform(*DELAY_BETWEEN_APPLICATIONS)
                 logger.info(f"Waiting {wait_time:.1f} seconds before next application")
                 time.sleep(wait_time)
                 
                 # Refresh job cards after each application as the page might have changed
-                if i < jobs_to_apply - 1:  # No need to refresh on last application
+                if attempts < max_applications and card_index < len(job_cards):  # No need to refresh on last application
                     try:
-                        # Refresh the search page
-                        current_url = driver.current_url
-                        driver.get(current_url)
+                        # Recycle the tab if it has grown too large; that also reloads the search page
+                        if not (watchdog and watchdog.check_tab(driver, f"after_application_{attempts}")):
+                            # Refresh the search page
+                            current_url = driver.current_url
+                            open_page(driver, current_url)
                         random_wait()
                         
                         # Get updated job cards
@@ -847,21 +1101,100 @@ def handle_job_search(driver, search):
             except Exception as application_error:
                 logger.error(f"Error in application #{i+1}: {str(application_error)}")
                 continue
+        
+        if prefetcher:
+            prefetcher.cancel_all()
                 
         return applied_count
     except Exception as e:
         logger.error(f"Error in job search: {str(e)}")
+        if prefetcher:
+            prefetcher.cancel_all()
         return 0
 
-def main():
+def handle_job_search_http(driver, discovery_session, search, watchdog=None, seen_job_ids=None,
+                           max_applications=MAX_APPLICATIONS, prefetcher=None, stats=None):
+    """Discover jobs over HTTP and only use the browser for the Easy Apply step"""
+    from http_discovery import iter_job_postings
+    
+    if seen_job_ids is None:
+        seen_job_ids = set()
+    if stats is not None:
+        stats["postings_found"] = 0
+    
+    applied_count = 0
+    attempts = 0
+    # A merged search may read one page of results per search it covers, fetched only once the budget needs it
+    for page in iter_job_postings(discovery_session, search["keywords"], search["location"],
+                                  max_pages=result_pages(search)):
+        postings = dedupe_postings(page, seen_job_ids)
+        if stats is not None:
+            stats["postings_found"] += len(postings)
+        # Details cached by an earlier search or session can rule postings out without opening them
+        cached_details = {posting["job_id"]: job_cache.get(posting["job_id"]) for posting in postings}
+        ruled_out = [job_id for job_id, details in cached_details.items() if details and details["easy_apply"] is False]
+        if ruled_out:
+            logger.info(f"Skipping {len(ruled_out)} postings whose cached details show no Easy Apply option")
+            postings = [posting for posting in postings if posting["job_id"] not in ruled_out]
+        
+        for i, posting in enumerate(postings):
+            if attempts >= max_applications:
+                break
+            attempts += 1
+            try:
+                logger.info(f"\nAttempting job application {attempts}/{max_applications}: {posting['title']} at {posting['company']}")
+                seen_job_ids.add(posting["job_id"])
+                
+                # Hand over this job's prefetched details and start on the next candidate
+                details = None
+                if prefetcher:
+                    details = prefetcher.take(posting["job_id"], PREFETCH_TAKE_TIMEOUT)
+                    if i + 1 < len(postings) and attempts < max_applications:
+                        prefetcher.prefetch(postings[i + 1]["job_id"])
+                
+                count_stat(stats, "attempted")
+                if apply_to_job_id(driver, posting["job_id"], attempts - 1, details or cached_details[posting["job_id"]],
+                                   stats):
+                    applied_count += 1
+                    count_stat(stats, "applied")
+                
+                if watchdog:
+                    watchdog.check_tab(driver, f"after_application_{attempts}")
+                
+                # Random wait between applications
+                wait_time = random.uniform(*DELAY_BETWEEN_APPLICATIONS)
+                logger.info(f"Waiting {wait_time:.1f} seconds before next application")
+                time.sleep(wait_time)
+            except Exception as application_error:
+                logger.error(f"Error in application #{attempts}: {str(application_error)}")
+                continue
+        if attempts >= max_applications:
+            break
+    
+    if not attempts:
+        logger.warning("No new job listings found")
+    if prefetcher:
+        prefetcher.cancel_all()
+    return applied_count
+
+def main(config=None):
     """Main function to run the job application automation"""
     driver = None
+    discovery_session = None
+    prefetcher = None
     applied_count = 0
     start_time = datetime.now()
+    watchdog = MemoryWatchdog(MEMORY_LIMITS_MB, MEMORY_SAMPLES_FILE)
+    scheduler = SearchScheduler(SEARCH_STATS_FILE)
+    if config is None:
+        config = load_config()
+    configure(config)
     
     try:
         logger.info("Starting LinkedIn job application automation")
         logger.info(f"Starting at: {start_time.strftime('%Y-%m-%d %H:%M:%S')}")
+        timeout_policy.load(TIMEOUT_PROFILE_FILE)
+        job_cache.open(JOB_CACHE_FILE)
         
         # Setup the WebDriver
         driver = setup_driver()
@@ -871,20 +1204,48 @@ def main():
             logger.error("Failed to login to LinkedIn, aborting process")
             return
         
-        # List of job searches to perform
-        job_searches = [
-            {"keywords": "Software Engineer", "location": "Remote"},
-            {"keywords": "Python Developer", "location": "New York"},
-            {"keywords": "Python Developer", "location": "Remote"}
-        ]
+        # Discover jobs over HTTP with the browser's cookies instead of rendering search pages
+        if DISCOVERY_MODE == "http":
+            from http_discovery import DiscoverySession
+            discovery_session = DiscoverySession.from_driver(driver)
+        
+        prefetcher = create_prefetcher(driver, discovery_session)
+        
+        # Merge overlapping searches, then run the best-yielding ones first with a share of the global limit
+        job_searches = plan_searches(JOB_SEARCHES)
+        session_limit = application_limit(config, JOB_SEARCHES)
+        schedule = scheduler.schedule(job_searches, session_limit)
+        seen_job_ids = set()
+        unused_budget = 0
         
         # Process each search
-        for search in job_searches:
-            search_applied_count = handle_job_search(driver, search)
+        for search_number, (search, budget) in enumerate(schedule):
+            if applied_count >= session_limit:
+                logger.info(f"Reached the application limit of {session_limit}, skipping remaining searches")
+                break
+            search_budget = min(budget + unused_budget, session_limit - applied_count)
+            if search_budget <= 0:
+                logger.info(f"No budget left for {search['keywords']} in {search['location']}, skipping")
+                continue
+            
+            search_stats = {}
+            search_start = time.monotonic()
+            search_applied_count = handle_job_search(driver, search, watchdog, discovery_session, seen_job_ids,
+                                                     search_budget, prefetcher, search_stats)
+            scheduler.record(search, search_stats, time.monotonic() - search_start)
             applied_count += search_applied_count
+            # Budget a search could not use rolls over to the next one
+            unused_budget = search_budget - search_applied_count
             
             # Take a short break between searches
-            if search != job_searches[-1]:  # If not the last search
+            if search_number < len(schedule) - 1:  # If not the last search
+                # Restart the browser between searches if it has grown too large
+                previous_driver = driver
+                driver = watchdog.check_browser(driver, setup_driver, f"after_search_{search['keywords']}")
+                if driver is not previous_driver and prefetcher:
+                    # The prefetch tab went away with the old browser
+                    prefetcher.close()
+                    prefetcher = create_prefetcher(driver, discovery_session)
                 wait_time = random.uniform(10, 15)
                 logger.info(f"Taking a {wait_time:.1f} second break before next search")
                 time.sleep(wait_time)
@@ -903,6 +1264,31 @@ def main():
         logger.info(f"Total duration: {duration}")
         logger.info(f"Total jobs applied to: {applied_count}")
         
+        if driver:
+            try:
+                watchdog.sample(driver, "session_end")
+            except Exception as e:
+                logger.warning(f"Could not sample browser memory: {str(e)}")
+        memory = watchdog.summary()
+        logger.info(f"Browser memory: {memory['samples']} samples recorded in {MEMORY_SAMPLES_FILE}, "
+                    f"peak browser RSS {memory['peak_browser_rss_mb']} MB, "
+                    f"peak renderer RSS {memory['peak_renderer_rss_mb']} MB, "
+                    f"peak JS heap {memory['peak_js_heap_used_mb']} MB, "
+                    f"{memory['tab_recycles']} tab / {memory['browser_recycles']} browser recycles")
+        
+        timeout_policy.save()
+        for row in timeout_policy.report():
+            if row["samples"] or row["timeouts"]:
+                logger.info(f"Wait '{row['name']}': configured {row['configured']}s, used {row['used']}s "
+                            f"(gap {row['gap']}s), p95 {row['p95']}s over {row['samples']} waits, "
+                            f"{row['timeouts']} timeouts")
+        
+        if prefetcher:
+            prefetcher.close()
+        logger.info(f"Job details cache: {job_cache.hits} hits, {job_cache.misses} misses, {len(job_cache)} entries")
+        job_cache.close()
+        if discovery_session:
+            discovery_session.close()
         if driver:
             driver.quit()
             logger.info("Browser closed successfully")
@@ -910,14 +1296,17 @@ def main():
 def verify_linkedin_credentials():
     """Verify that the LinkedIn credentials are properly set"""
     if LINKEDIN_EMAIL == "your_email@example.com" or LINKEDIN_PASSWORD == "your_password":
-        logger.error("ERROR: You need to update the LinkedIn credentials in the script!")
-        logger.error("Please replace 'your_email@example.com' and 'your_password' with your actual LinkedIn credentials.")
+        logger.error("ERROR: You need to set the LinkedIn credentials in config.json!")
+        logger.error("Please fill in linkedin_credentials.email and linkedin_credentials.password with your actual LinkedIn credentials.")
         return False
     return True
 
 if __name__ == "__main__":
+    configure_logging()
+    config = load_config()
+    configure(config)
     # Check if credentials are set before running
     if verify_linkedin_credentials():
-        main()
+        main(config)
     else:
-        print("Please update your LinkedIn credentials in the script before running.")
\ No newline at end of file
+        print("Please set your LinkedIn credentials in config.json before running.")
\ No newline at end of file
@@ -0,0 +1,136 @@
+"""Benchmark the Selenium and CDP driver backends against a local headless Chrome.
+
+Serves a small Easy Apply-like page from a local HTTP server and times the
+operations Linkedinauto.py relies on (navigate, find, click, type,
+execute_script, screenshot, wait-for) on each backend.
+
+    python bench_driver.py --iterations 20 --backends selenium cdp
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from selenium.webdriver.common.by import By
+
+from Linkedinauto import setup_driver, wait_for_presence
+
+BENCH_PAGE = """<!DOCTYPE html>
+<html><head><title>Bench</title></head>
+<body>
+  <div class="jobs-search-results-list">
+    %(cards)s
+  </div>
+  <div class="jobs-easy-apply-content">
+    <input type="text" id="phone" name="phone">
+    <input type="radio" id="yes" name="q1"><label for="yes">Yes</label>
+    <input type="radio" id="no" name="q1"><label for="no">No</label>
+    <input type="checkbox" id="terms"><label for="terms">I agree</label>
+    <button id="next" onclick="setTimeout(() => {
+        const done = document.createElement('div');
+        done.className = 'application-submitted';
+        done.textContent = 'Application submitted';
+        document.body.appendChild(done);
+    }, 50)">Next</button>
+  </div>
+</body></html>
+""" % {"cards": "\n    ".join(
+    f'<div class="job-card-container" data-job-id="{i}"><a href="#">Job {i}</a></div>' for i in range(25))}
+
+
+class BenchPageHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = BENCH_PAGE.encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), BenchPageHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def run_backend(backend, url, iterations, screenshot_dir):
+    """Return {operation: [seconds, ...]} for one backend"""
+    timings = {}
+
+    def timed(name, func):
+        start = time.perf_counter()
+        result = func()
+        timings.setdefault(name, []).append(time.perf_counter() - start)
+        return result
+
+    start = time.perf_counter()
+    driver = setup_driver(backend, headless=True)
+    timings["startup"] = [time.perf_counter() - start]
+    try:
+        for i in range(iterations):
+            timed("navigate", lambda: driver.get(url))
+            timed("find_elements (25 cards)", lambda: driver.find_elements(By.CSS_SELECTOR, ".job-card-container"))
+            timed("find_element by xpath", lambda: driver.find_element(By.XPATH, "//label[@for='yes']"))
+            field = driver.find_element(By.ID, "phone")
+            timed("send_keys", lambda: field.send_keys("5551234567"))
+            radio = driver.find_element(By.ID, "yes")
+            timed("click", radio.click)
+            timed("is_displayed x25", lambda: [card.is_displayed() for card in
+                                               driver.find_elements(By.CSS_SELECTOR, ".job-card-container")])
+            timed("execute_script", lambda: driver.execute_script("arguments[0].scrollIntoView(true);", radio))
+            driver.find_element(By.ID, "next").click()
+            timed("wait-for (50 ms async DOM change)",
+                  lambda: wait_for_presence(driver, [(By.CSS_SELECTOR, ".application-submitted")], 10))
+            timed("screenshot", lambda: driver.save_screenshot(os.path.join(screenshot_dir, f"{backend}_{i}.png")))
+
+            expressions = [f"document.querySelectorAll('.job-card-container')[{n}].dataset.jobId" for n in range(20)]
+            if hasattr(driver, "evaluate_many"):
+                timed("20 scripts (pipelined)", lambda: driver.evaluate_many(expressions))
+            timed("20 scripts (sequential)",
+                  lambda: [driver.execute_script(f"return {expression};") for expression in expressions])
+    finally:
+        driver.quit()
+    return timings
+
+
+def print_report(results):
+    operations = []
+    for timings in results.values():
+        operations.extend(name for name in timings if name not in operations)
+
+    backends = list(results)
+    print(f"{'operation':<36}" + "".join(f"{backend + ' median ms':>22}" for backend in backends))
+    for name in operations:
+        row = f"{name:<36}"
+        for backend in backends:
+            samples = results[backend].get(name)
+            row += f"{statistics.median(samples) * 1000:>22.1f}" if samples else f"{'-':>22}"
+        print(row)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare Selenium and CDP driver backends")
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--backends", nargs="+", default=["selenium", "cdp"], choices=["selenium", "cdp"])
+    args = parser.parse_args(argv)
+
+    server = start_server()
+    url = f"http://127.0.0.1:{server.server_address[1]}/"
+    try:
+        with tempfile.TemporaryDirectory() as screenshot_dir:
+            results = {backend: run_backend(backend, url, args.iterations, screenshot_dir)
+                       for backend in args.backends}
+    finally:
+        server.shutdown()
+    print_report(results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Benchmark the Easy Apply form logic on the in-process fake driver.
+
+Runs check_easy_apply, complete_application and the full details-to-submit
+path against the HTML fixtures in fixtures/ without a browser, and reports
+time per run and driver round trips per code path. Human-like waits are
+disabled so the numbers reflect the script's own decision logic plus the
+simulated per-command latency.
+
+    python bench_forms.py --runs 1000 --latency-ms 0
+"""
+import argparse
+import logging
+import os
+import time
+from unittest import mock
+
+import Linkedinauto
+from fake_driver import FakeDriver
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+FORM_FIXTURES = ["job_details.html", "easy_apply_form.html"]
+
+# What a finished prefetch hands to the apply loop for job_details.html
+PREFETCHED_DETAILS = {"title": "Python Developer", "company": "Acme Corp", "location": "New York, NY (Hybrid)",
+                      "description": "We are looking for a Python Developer.", "easy_apply": True}
+
+# Code paths to benchmark: (name, start page, function, expected result)
+SCENARIOS = [
+    ("check_easy_apply", "job_details.html", Linkedinauto.check_easy_apply, True),
+    ("complete_application (3 steps)", "easy_apply_form.html",
+     lambda driver: Linkedinauto.complete_application(driver, 0), True),
+    ("apply_from_job_details", "job_details.html",
+     lambda driver: Linkedinauto.apply_from_job_details(driver, 0), True),
+    ("apply_from_job_details (prefetched)", "job_details.html",
+     lambda driver: Linkedinauto.apply_from_job_details(driver, 0, PREFETCHED_DETAILS), True),
+]
+
+
+def run_scenario(pages, start_page, func, expected, runs, latency):
+    """Return (seconds per run, command counts of one run)"""
+    elapsed = 0.0
+    counts = None
+    for _ in range(runs):
+        driver = FakeDriver(pages, start_page=start_page, latency=latency)
+        start = time.perf_counter()
+        result = func(driver)
+        elapsed += time.perf_counter() - start
+        if result != expected:
+            raise AssertionError(f"Expected {expected}, got {result} (ended on {driver.current_url})")
+        counts = driver.command_counts
+    return elapsed / runs, counts
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark form-step logic on the fake driver")
+    parser.add_argument("--runs", type=int, default=200)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="simulated round-trip latency per command")
+    parser.add_argument("--verbose", action="store_true", help="show per-command counts")
+    args = parser.parse_args(argv)
+
+    pages = {}
+    for name in FORM_FIXTURES:
+        with open(os.path.join(FIXTURE_DIR, name), encoding="utf-8") as f:
+            pages[name] = f.read()
+
+    logging.getLogger().setLevel(logging.WARNING)
+    latency = args.latency_ms / 1000
+    # No human-like pauses: the fake driver keeps its own latency since it imported sleep directly
+    with mock.patch.object(Linkedinauto, "WAIT_TIME_BETWEEN_ACTIONS", (0, 0)), \
+            mock.patch.object(Linkedinauto.time, "sleep", lambda seconds: None):
+        print(f"{'code path':<40}{'ms/run':>10}{'round trips':>14}")
+        for name, start_page, func, expected in SCENARIOS:
+            per_run, counts = run_scenario(pages, start_page, func, expected, args.runs, latency)
+            print(f"{name:<40}{per_run * 1000:>10.2f}{sum(counts.values()):>14}")
+            if args.verbose:
+                for command, count in counts.most_common():
+                    print(f"    {command:<36}{count:>14}")
+
+
+if __name__ == "__main__":
+    main()
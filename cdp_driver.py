@@ -0,0 +1,625 @@
+"""Chrome DevTools Protocol driver backend.
+
+Drives Chrome directly over its DevTools websocket with asyncio instead of
+going through chromedriver's one-HTTP-request-per-command protocol. A single
+websocket carries every tab (flattened target sessions), commands are sent
+without waiting for the previous reply so they can be pipelined, and waits are
+resolved by a MutationObserver inside the page instead of being polled.
+
+`CDPDriver` exposes the subset of the Selenium WebDriver API that
+Linkedinauto.py uses (get, find_element(s), click, send_keys,
+execute_script, save_screenshot, window handles), so the rest of the script
+does not need to know which backend it is talking to.
+
+Requires the `websockets` package and a local Chrome/Chromium binary.
+"""
+import asyncio
+import base64
+import concurrent.futures
+import itertools
+import json
+import logging
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+
+try:
+    from selenium.common.exceptions import NoSuchElementException, TimeoutException
+except ImportError:  # Selenium is optional when only the CDP backend is used
+    class NoSuchElementException(Exception):
+        """No element matched the locator"""
+
+    class TimeoutException(Exception):
+        """A wait did not complete in time"""
+
+logger = logging.getLogger()
+
+CHROME_BINARIES = ["google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome"]
+DEVTOOLS_STARTUP_TIMEOUT = 20  # Seconds to wait for Chrome to open its DevTools port
+COMMAND_TIMEOUT = 60  # Seconds to wait for DevTools replies, on top of any wait the command itself makes
+
+# Resolves a Selenium-style (by, value) locator relative to `this` (document or element)
+FIND_ELEMENTS_JS = """function(by, value) {
+    const root = this;
+    switch (by) {
+        case 'css selector': return Array.from(root.querySelectorAll(value));
+        case 'id': return Array.from(root.querySelectorAll('#' + CSS.escape(value)));
+        case 'name': return Array.from(root.querySelectorAll('[name="' + CSS.escape(value) + '"]'));
+        case 'class name': return Array.from(root.querySelectorAll('.' + CSS.escape(value)));
+        case 'tag name': return Array.from(root.getElementsByTagName(value));
+        case 'xpath': {
+            const doc = root.ownerDocument || root;
+            const snapshot = doc.evaluate(value, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            const nodes = [];
+            for (let i = 0; i < snapshot.snapshotLength; i++) nodes.push(snapshot.snapshotItem(i));
+            return nodes;
+        }
+    }
+    throw new Error('Unsupported locator strategy: ' + by);
+}"""
+
+# Resolves as soon as any locator matches, re-checking only when the DOM changes
+WAIT_FOR_ANY_JS = """function(find, locators, timeoutMs) {
+    return new Promise((resolve) => {
+        const matches = () => locators.some(([by, value]) => find.call(document, by, value).length > 0);
+        if (matches()) { resolve(true); return; }
+        const observer = new MutationObserver(() => {
+            if (matches()) { observer.disconnect(); clearTimeout(timer); resolve(true); }
+        });
+        observer.observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+        const timer = setTimeout(() => { observer.disconnect(); resolve(false); }, timeoutMs);
+    });
+}"""
+
+ELEMENT_CENTER_JS = """function() {
+    if (this.tagName === 'OPTION') {
+        // Options of a collapsed <select> have no box, so choose them the way picking from the list would
+        const select = this.closest('select');
+        this.selected = select && select.multiple ? !this.selected : true;
+        if (select) {
+            select.dispatchEvent(new Event('input', {bubbles: true}));
+            select.dispatchEvent(new Event('change', {bubbles: true}));
+        }
+        return null;
+    }
+    this.scrollIntoView({block: 'center', inline: 'center'});
+    const rect = this.getBoundingClientRect();
+    return [rect.left + rect.width / 2, rect.top + rect.height / 2, rect.width, rect.height];
+}"""
+
+IS_DISPLAYED_JS = """function() {
+    if (!this.isConnected) return false;
+    const style = window.getComputedStyle(this);
+    if (style.visibility === 'hidden' || style.display === 'none' || style.opacity === '0') return false;
+    return this.getClientRects().length > 0;
+}"""
+
+GET_ATTRIBUTE_JS = """function(name) {
+    const property = this[name];
+    if (property !== undefined && property !== null && typeof property !== 'object' && typeof property !== 'function') {
+        if (typeof property === 'boolean') return property ? 'true' : null;
+        return String(property);
+    }
+    return this.getAttribute(name);
+}"""
+
+# Errors raised when a navigation tears down the context a script was running in
+CONTEXT_DESTROYED_ERRORS = ("Execution context was destroyed", "Cannot find context with specified id",
+                            "Inspected target navigated or closed")
+
+
+class CDPError(Exception):
+    """Raised when Chrome reports an error for a DevTools command"""
+
+
+class CDPConnection:
+    """A single DevTools websocket shared by the browser and all attached tabs"""
+
+    def __init__(self, websocket):
+        self._websocket = websocket
+        self._ids = itertools.count(1)
+        self._pending = {}
+        self._listeners = []
+        self._reader = None
+
+    @classmethod
+    async def connect(cls, url):
+        """Open the browser-level websocket and start dispatching messages"""
+        import websockets
+
+        websocket = await websockets.connect(url, max_size=None)
+        connection = cls(websocket)
+        connection._reader = asyncio.get_running_loop().create_task(connection._read_loop())
+        return connection
+
+    async def _read_loop(self):
+        try:
+            async for raw in self._websocket:
+                message = json.loads(raw)
+                if "id" in message:
+                    future = self._pending.pop(message["id"], None)
+                    if future is None or future.done():
+                        continue
+                    if "error" in message:
+                        future.set_exception(CDPError(message["error"].get("message", str(message["error"]))))
+                    else:
+                        future.set_result(message.get("result", {}))
+                else:
+                    for listener in list(self._listeners):
+                        listener(message)
+        except Exception as e:
+            logger.warning(f"DevTools connection closed: {str(e)}")
+        finally:
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(CDPError("DevTools connection closed"))
+            self._pending.clear()
+
+    async def send(self, method, params=None, session_id=None):
+        """Send a command and wait for its result; concurrent sends are pipelined"""
+        message_id = next(self._ids)
+        message = {"id": message_id, "method": method, "params": params or {}}
+        if session_id:
+            message["sessionId"] = session_id
+        future = asyncio.get_running_loop().create_future()
+        self._pending[message_id] = future
+        try:
+            await self._websocket.send(json.dumps(message))
+            return await future
+        finally:
+            # Drop commands the caller gave up on, so late replies are ignored
+            self._pending.pop(message_id, None)
+
+    def wait_for_event(self, method, session_id=None):
+        """Return a future for the next `method` event; register it before triggering the event"""
+        future = asyncio.get_running_loop().create_future()
+
+        def listener(message):
+            if message.get("method") == method and message.get("sessionId") == session_id and not future.done():
+                future.set_result(message.get("params", {}))
+
+        self._listeners.append(listener)
+        future.add_done_callback(lambda _: self._listeners.remove(listener))
+        return future
+
+    async def close(self):
+        await self._websocket.close()
+        if self._reader:
+            await asyncio.gather(self._reader, return_exceptions=True)
+
+
+class CDPPage:
+    """Async operations on one attached tab"""
+
+    def __init__(self, connection, target_id, session_id):
+        self.connection = connection
+        self.target_id = target_id
+        self.session_id = session_id
+
+    async def call(self, method, params=None):
+        return await self.connection.send(method, params, self.session_id)
+
+    async def navigate(self, url, timeout):
+        loaded = self.connection.wait_for_event("Page.loadEventFired", self.session_id)
+        try:
+            result = await self.call("Page.navigate", {"url": url})
+            if result.get("errorText"):
+                raise CDPError(f"Navigation to {url} failed: {result['errorText']}")
+            if result.get("loaderId"):  # Same-document navigations never fire a load event
+                await asyncio.wait_for(loaded, timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutException(f"Timed out after {timeout}s loading {url}")
+        finally:
+            loaded.cancel()
+
+    async def evaluate(self, expression, return_by_value=True, await_promise=False):
+        response = await self.call("Runtime.evaluate", {
+            "expression": expression,
+            "returnByValue": return_by_value,
+            "awaitPromise": await_promise,
+        })
+        return _check_exception(response)
+
+    async def call_function(self, object_id, declaration, args=(), return_by_value=True):
+        response = await self.call("Runtime.callFunctionOn", {
+            "objectId": object_id,
+            "functionDeclaration": declaration,
+            "arguments": list(args),
+            "returnByValue": return_by_value,
+        })
+        return _check_exception(response)
+
+    async def find_all(self, by, value, root_object_id=None):
+        """Return the object IDs of every element matching the locator"""
+        if root_object_id:
+            array = await self.call_function(root_object_id, FIND_ELEMENTS_JS,
+                                             [{"value": by}, {"value": value}], return_by_value=False)
+        else:
+            expression = f"({FIND_ELEMENTS_JS}).call(document, {json.dumps(by)}, {json.dumps(value)})"
+            array = await self.evaluate(expression, return_by_value=False)
+        if "objectId" not in array:
+            return []
+        properties = await self.call("Runtime.getProperties", {"objectId": array["objectId"], "ownProperties": True})
+        asyncio.ensure_future(self.call("Runtime.releaseObject", {"objectId": array["objectId"]}))
+        indexed = [(int(p["name"]), p["value"]["objectId"]) for p in properties.get("result", [])
+                   if p["name"].isdigit() and "objectId" in p.get("value", {})]
+        return [object_id for _, object_id in sorted(indexed)]
+
+    async def wait_for(self, locators, timeout):
+        """Wait for any locator to match, driven by DOM mutations rather than polling"""
+        deadline = time.monotonic() + timeout
+        payload = json.dumps([list(locator) for locator in locators])
+        while True:
+            remaining_ms = max(0, int((deadline - time.monotonic()) * 1000))
+            expression = f"({WAIT_FOR_ANY_JS})({FIND_ELEMENTS_JS}, {payload}, {remaining_ms})"
+            try:
+                found = await self.evaluate(expression, await_promise=True)
+                if found.get("value"):
+                    return True
+            except CDPError as e:
+                if not any(marker in str(e) for marker in CONTEXT_DESTROYED_ERRORS):
+                    raise
+                await asyncio.sleep(0.05)  # Page navigated mid-wait, retry in the new document
+            if time.monotonic() >= deadline:
+                raise TimeoutException(f"None of {locators} appeared within {timeout}s")
+
+    async def click(self, object_id):
+        center = (await self.call_function(object_id, ELEMENT_CENTER_JS)).get("value")
+        if center is None:  # An <option>, already selected in the page
+            return
+        x, y, width, height = center
+        if width == 0 or height == 0:
+            raise CDPError("Element is not interactable (zero size)")
+        mouse = {"x": x, "y": y, "button": "left", "clickCount": 1}
+        await asyncio.gather(
+            self.call("Input.dispatchMouseEvent", {"type": "mouseMoved", "x": x, "y": y}),
+            self.call("Input.dispatchMouseEvent", dict(mouse, type="mousePressed")),
+            self.call("Input.dispatchMouseEvent", dict(mouse, type="mouseReleased")),
+        )
+
+    async def type_text(self, object_id, text):
+        await asyncio.gather(
+            self.call_function(object_id, "function() { this.focus(); }"),
+            self.call("Input.insertText", {"text": text}),
+        )
+
+    async def screenshot(self):
+        result = await self.call("Page.captureScreenshot", {"format": "png"})
+        return base64.b64decode(result["data"])
+
+
+def _check_exception(response):
+    if "exceptionDetails" in response:
+        details = response["exceptionDetails"]
+        description = details.get("exception", {}).get("description") or details.get("text", "Script error")
+        raise CDPError(description)
+    return response.get("result", {})
+
+
+class CDPElement:
+    """Selenium WebElement look-alike bound to a DevTools remote object"""
+
+    def __init__(self, tab, object_id):
+        self._tab = tab
+        self.object_id = object_id
+
+    def __del__(self):
+        # Remote objects otherwise live as long as the document, which on a single-page app is the whole session
+        try:
+            self._tab.release(self.object_id)
+        except Exception:
+            pass
+
+    def _call(self, declaration, *args):
+        coroutine = self._tab.page.call_function(self.object_id, declaration, [{"value": arg} for arg in args])
+        return self._tab.run(coroutine).get("value")
+
+    @property
+    def text(self):
+        return self._call("function() { return this.innerText || this.textContent || ''; }").strip()
+
+    @property
+    def tag_name(self):
+        return self._call("function() { return this.tagName.toLowerCase(); }")
+
+    def click(self):
+        self._tab.run(self._tab.page.click(self.object_id))
+
+    def send_keys(self, *values):
+        self._tab.run(self._tab.page.type_text(self.object_id, "".join(str(value) for value in values)))
+
+    def clear(self):
+        self._call("function() { this.value = ''; this.dispatchEvent(new Event('input', {bubbles: true})); }")
+
+    def get_attribute(self, name):
+        return self._call(GET_ATTRIBUTE_JS, name)
+
+    def get_property(self, name):
+        return self._call("function(name) { return this[name]; }", name)
+
+    def is_displayed(self):
+        return bool(self._call(IS_DISPLAYED_JS))
+
+    def is_selected(self):
+        return bool(self._call("function() { return !!(this.checked || this.selected); }"))
+
+    def is_enabled(self):
+        return not self._call("function() { return !!this.disabled; }")
+
+    def find_elements(self, by, value):
+        object_ids = self._tab.run(self._tab.page.find_all(by, value, root_object_id=self.object_id))
+        return [CDPElement(self._tab, object_id) for object_id in object_ids]
+
+    def find_element(self, by, value):
+        elements = self.find_elements(by, value)
+        if not elements:
+            raise NoSuchElementException(f"No element found for {by}={value}")
+        return elements[0]
+
+
+class CDPTab:
+    """Synchronous facade over one tab; safe to use from any thread"""
+
+    def __init__(self, driver, page):
+        self._driver = driver
+        self.page = page
+
+    @property
+    def handle(self):
+        return self.page.target_id
+
+    def run(self, coroutine, timeout=COMMAND_TIMEOUT):
+        return self._driver.run(coroutine, timeout)
+
+    def release(self, object_id):
+        """Let the renderer free a remote object, without waiting for the reply"""
+        if self._driver._loop.is_running():
+            asyncio.run_coroutine_threadsafe(self.page.call("Runtime.releaseObject", {"objectId": object_id}),
+                                             self._driver._loop)
+
+    def get(self, url):
+        timeout = self._driver.page_load_timeout
+        self.run(self.page.navigate(url, timeout), timeout + COMMAND_TIMEOUT)
+
+    @property
+    def current_url(self):
+        return self.run(self.page.evaluate("location.href")).get("value")
+
+    @property
+    def title(self):
+        return self.run(self.page.evaluate("document.title")).get("value")
+
+    def find_elements(self, by, value):
+        return [CDPElement(self, object_id) for object_id in self.run(self.page.find_all(by, value))]
+
+    def find_element(self, by, value):
+        elements = self.find_elements(by, value)
+        if not elements:
+            raise NoSuchElementException(f"No element found for {by}={value}")
+        return elements[0]
+
+    def wait_for(self, locators, timeout):
+        """Event-driven equivalent of WebDriverWait(...).until(EC.any_of(presence...))"""
+        return self.run(self.page.wait_for(locators, timeout), timeout + COMMAND_TIMEOUT)
+
+    def execute_script(self, script, *args):
+        return self.run(self._execute_script(script, args))
+
+    def evaluate_many(self, expressions):
+        """Evaluate several expressions in one pipelined burst and return their values"""
+        async def evaluate_all():
+            results = await asyncio.gather(*(self.page.evaluate(expression) for expression in expressions))
+            return [result.get("value") for result in results]
+        return self.run(evaluate_all())
+
+    async def _execute_script(self, script, args):
+        declaration = "function() {\n" + script + "\n}"
+        element_args = [arg for arg in args if isinstance(arg, CDPElement)]
+        if element_args:
+            call_args = [{"objectId": arg.object_id} if isinstance(arg, CDPElement) else {"value": arg} for arg in args]
+            result = await self.page.call_function(element_args[0].object_id, declaration, call_args,
+                                                   return_by_value=False)
+        else:
+            expression = f"({declaration}).apply(null, {json.dumps(list(args))})"
+            result = await self.page.evaluate(expression, return_by_value=False)
+
+        if result.get("subtype") == "node":
+            return CDPElement(self, result["objectId"])
+        if result.get("type") == "undefined" or result.get("subtype") == "null":
+            return None
+        if "value" in result:
+            return result["value"]
+        by_value = await self.page.call_function(result["objectId"], "function() { return this; }")
+        return by_value.get("value")
+
+    def save_screenshot(self, filename):
+        data = self.run(self.page.screenshot())
+        with open(filename, "wb") as f:
+            f.write(data)
+        return True
+
+    def execute_cdp_cmd(self, cmd, cmd_args=None):
+        return self.run(self.page.call(cmd, cmd_args))
+
+
+class _SwitchTo:
+    def __init__(self, driver):
+        self._driver = driver
+
+    def window(self, handle):
+        self._driver._current = self._driver._tabs[handle]
+        # Like Selenium, switching also shows the tab
+        self._driver._current.execute_cdp_cmd("Page.bringToFront")
+
+    def new_window(self, type_hint="tab"):
+        tab = self._driver.new_tab()
+        self.window(tab.handle)
+        return tab
+
+
+class CDPDriver:
+    """Chrome controlled over the DevTools Protocol with a Selenium-compatible surface"""
+
+    def __init__(self, chrome_binary=None, headless=False, arguments=(), page_load_timeout=30):
+        self.page_load_timeout = page_load_timeout
+        self._tabs = {}
+        self._current = None
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="cdp-driver", daemon=True)
+        self._thread.start()
+
+        self.user_data_dir = tempfile.mkdtemp(prefix="cdp-profile-")
+        self.process = None
+        try:
+            self.process = self._launch_chrome(chrome_binary, headless, arguments)
+            self._connection = self.run(CDPConnection.connect(self._devtools_url()))
+            targets = self.run(self._connection.send("Target.getTargets"))["targetInfos"]
+            pages = [target for target in targets if target["type"] == "page"]
+            self._current = self._attach(pages[0]["targetId"]) if pages else self.new_tab()
+        except Exception:
+            self.quit()
+            raise
+        self.switch_to = _SwitchTo(self)
+
+    def run(self, coroutine, timeout=COMMAND_TIMEOUT):
+        """Run a coroutine on the driver's event loop and block for its result, at most `timeout` seconds"""
+        future = asyncio.run_coroutine_threadsafe(coroutine, self._loop)
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            # A reply that never comes would otherwise block the caller for good
+            future.cancel()
+            raise TimeoutException(f"No reply from Chrome within {timeout}s")
+
+    def _launch_chrome(self, chrome_binary, headless, arguments):
+        binary = chrome_binary or os.environ.get("CHROME_BINARY")
+        if not binary:
+            binary = next((shutil.which(name) for name in CHROME_BINARIES if shutil.which(name)), None)
+        if not binary:
+            raise RuntimeError("Could not find a Chrome/Chromium binary; set CHROME_BINARY")
+
+        command = [binary, "--remote-debugging-port=0", f"--user-data-dir={self.user_data_dir}",
+                   "--no-first-run", "--no-default-browser-check"]
+        if headless:
+            command.append("--headless=new")
+        command.extend(argument for argument in arguments if not argument.startswith("--remote-debugging"))
+        command.append("about:blank")
+        return subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    def _devtools_url(self):
+        port_file = os.path.join(self.user_data_dir, "DevToolsActivePort")
+        deadline = time.monotonic() + DEVTOOLS_STARTUP_TIMEOUT
+        while time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                raise RuntimeError(f"Chrome exited during startup with code {self.process.returncode}")
+            try:
+                with open(port_file) as f:
+                    lines = f.read().splitlines()
+                if len(lines) >= 2:
+                    return f"ws://127.0.0.1:{lines[0]}{lines[1]}"
+            except FileNotFoundError:
+                pass
+            time.sleep(0.05)
+        raise RuntimeError("Chrome did not open its DevTools port in time")
+
+    def _attach(self, target_id):
+        async def attach():
+            attached = await self._connection.send("Target.attachToTarget", {"targetId": target_id, "flatten": True})
+            page = CDPPage(self._connection, target_id, attached["sessionId"])
+            await page.call("Page.enable")
+            return page
+        tab = CDPTab(self, self.run(attach()))
+        self._tabs[target_id] = tab
+        return tab
+
+    def new_tab(self, url="about:blank"):
+        """Open a tab on the shared connection without switching to it"""
+        # In the background, so a headed browser keeps showing (and not throttling) the current tab
+        created = self.run(self._connection.send("Target.createTarget", {"url": url, "background": True}))
+        return self._attach(created["targetId"])
+
+    def close_tab(self, tab):
+        self.run(self._connection.send("Target.closeTarget", {"targetId": tab.handle}))
+        self._tabs.pop(tab.handle, None)
+        if self._current is tab:
+            self._current = None
+
+    @property
+    def window_handles(self):
+        return list(self._tabs)
+
+    @property
+    def current_window_handle(self):
+        return self._current.handle
+
+    def close(self):
+        self.close_tab(self._current)
+
+    # Selenium-compatible operations on the current tab
+
+    def get(self, url):
+        self._current.get(url)
+
+    @property
+    def current_url(self):
+        return self._current.current_url
+
+    @property
+    def title(self):
+        return self._current.title
+
+    def find_element(self, by, value):
+        return self._current.find_element(by, value)
+
+    def find_elements(self, by, value):
+        return self._current.find_elements(by, value)
+
+    def wait_for(self, locators, timeout):
+        return self._current.wait_for(locators, timeout)
+
+    def execute_script(self, script, *args):
+        return self._current.execute_script(script, *args)
+
+    def evaluate_many(self, expressions):
+        return self._current.evaluate_many(expressions)
+
+    def save_screenshot(self, filename):
+        return self._current.save_screenshot(filename)
+
+    def execute_cdp_cmd(self, cmd, cmd_args=None):
+        return self._current.execute_cdp_cmd(cmd, cmd_args)
+
+    def set_page_load_timeout(self, timeout):
+        self.page_load_timeout = timeout
+
+    def maximize_window(self):
+        try:
+            window = self.execute_cdp_cmd("Browser.getWindowForTarget", {"targetId": self._current.handle})
+            self.execute_cdp_cmd("Browser.setWindowBounds",
+                                 {"windowId": window["windowId"], "bounds": {"windowState": "maximized"}})
+        except CDPError as e:
+            logger.debug(f"Could not maximize window: {str(e)}")
+
+    def quit(self):
+        try:
+            if getattr(self, "_connection", None):
+                try:
+                    self.run(self._connection.send("Browser.close"), timeout=5)
+                except Exception:
+                    pass
+                self.run(self._connection.close(), timeout=5)
+        except Exception as e:
+            logger.debug(f"Error closing DevTools connection: {str(e)}")
+        finally:
+            if self.process is not None and self.process.poll() is None:
+                self.process.terminate()
+                try:
+                    self.process.wait(timeout=10)
+                except subprocess.TimeoutExpired:
+                    self.process.kill()
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout=5)
+            shutil.rmtree(self.user_data_dir, ignore_errors=True)
@@ -0,0 +1,178 @@
+"""Command-line entry point for the LinkedIn automation.
+
+Each subcommand imports only what it needs: `plan` and `stats` read
+config.json and the local state files without Selenium or a browser, so
+they start in well under a second; `run` and `bench` load the automation.
+
+    python cli.py plan                         # searches, budgets and cached candidates (dry run)
+    python cli.py stats                        # search yield, learned timeouts, cache and queue
+    python cli.py run                          # apply session in one browser
+    python cli.py run --stage both --workers 2 # discovery and apply stages over the work queue
+    python cli.py bench forms --runs 1000      # bench_forms.py / bench_driver.py
+"""
+import argparse
+import logging
+import os
+import sys
+
+from settings import (CONFIG_FILE, SEARCH_STATS_FILE, WAIT_TIMEOUTS, TIMEOUT_PROFILE_FILE, JOB_CACHE_FILE,
+                      JOB_CACHE_TTL_HOURS, JOB_CACHE_MAX_ENTRIES, QUEUE_FILE, configure_logging, load_config,
+                      configured_searches, application_limit)
+
+
+def print_table(rows, columns):
+    """Print dicts as left-aligned columns"""
+    widths = {column: max([len(column)] + [len(str(row[column])) for row in rows]) for column in columns}
+    print("  ".join(column.ljust(widths[column]) for column in columns))
+    for row in rows:
+        print("  ".join(str(row[column]).ljust(widths[column]) for column in columns))
+
+
+def open_job_cache():
+    """The job details cache if it exists, without creating it"""
+    from job_cache import JobDetailsCache
+    job_cache = JobDetailsCache(JOB_CACHE_TTL_HOURS * 3600, JOB_CACHE_MAX_ENTRIES)
+    if os.path.exists(JOB_CACHE_FILE):
+        job_cache.open(JOB_CACHE_FILE)
+    return job_cache
+
+
+def open_work_queue():
+    """The work queue if it exists, without creating it"""
+    from work_queue import WorkQueue
+    return WorkQueue(QUEUE_FILE) if os.path.exists(QUEUE_FILE) else None
+
+
+def plan(config, candidates=10):
+    """Print the search plan, each search's budget and the cached candidates without starting a browser"""
+    from search_planner import plan_searches
+    from search_scheduler import SearchScheduler
+
+    credentials = config.get("linkedin_credentials", {})
+    if not credentials.get("email") or not credentials.get("password"):
+        print("Warning: linkedin_credentials are not set in config.json, 'run' will refuse to start\n")
+
+    searches = configured_searches(config)
+    limit = application_limit(config, searches)
+    planned = plan_searches(searches)
+    scheduler = SearchScheduler(SEARCH_STATS_FILE)
+    schedule = scheduler.schedule(planned, limit)
+    print(f"{len(searches)} configured searches merged into {len(planned)} queries, application limit {limit}\n")
+    print_table([{"budget": budget,
+                  "apps/min": f"{scheduler.expected_rate(search):.2f}",
+                  "covers": len(search.get("covers", [])),
+                  "keywords": search["keywords"],
+                  "location": search["location"]} for search, budget in schedule],
+                ["budget", "apps/min", "covers", "keywords", "location"])
+
+    queue = open_work_queue()
+    if queue:
+        print(f"\nWork queue: {queue.counts()}")
+        queued = queue.peek(candidates)
+        if queued:
+            print_table([{"job_id": job_id, "title": payload.get("title"), "company": payload.get("company")}
+                         for job_id, payload in queued], ["job_id", "title", "company"])
+        queue.close()
+
+    job_cache = open_job_cache()
+    cached = job_cache.candidates(candidates)
+    print(f"\nJob details cache: {len(job_cache)} entries")
+    if cached:
+        print_table([{"job_id": details["job_id"], "title": details["title"], "company": details["company"],
+                      "easy_apply": details["easy_apply"]} for details in cached],
+                    ["job_id", "title", "company", "easy_apply"])
+    job_cache.close()
+
+
+def stats():
+    """Print search yield history, learned wait timeouts and the state of the cache and queue"""
+    from search_scheduler import SearchScheduler
+    from timeout_policy import TimeoutPolicy
+
+    rows = SearchScheduler(SEARCH_STATS_FILE).report()
+    print(f"Search history ({SEARCH_STATS_FILE}):")
+    if rows:
+        print_table(rows, ["search", "runs", "postings_found", "easy_apply_rate", "success_rate",
+                           "seconds_per_application"])
+    else:
+        print("  no searches recorded yet")
+
+    print(f"\nWait timeouts ({TIMEOUT_PROFILE_FILE}):")
+    print_table(TimeoutPolicy(WAIT_TIMEOUTS, TIMEOUT_PROFILE_FILE).report(),
+                ["name", "configured", "used", "gap", "samples", "p95", "timeouts"])
+
+    job_cache = open_job_cache()
+    print(f"\nJob details cache: {len(job_cache)} entries, TTL {JOB_CACHE_TTL_HOURS} h")
+    job_cache.close()
+    queue = open_work_queue()
+    if queue:
+        print(f"Work queue: {queue.counts()}")
+        queue.close()
+
+
+def run(config, args):
+    configure_logging()
+    import Linkedinauto
+    Linkedinauto.configure(config)
+    if not Linkedinauto.verify_linkedin_credentials():
+        print("Please set your LinkedIn credentials in config.json before running.")
+        return 1
+
+    if args.stage:
+        from pipeline import run_pipeline
+        run_pipeline(args.stage, args.workers, QUEUE_FILE, args.drain, config)
+        return 0
+    Linkedinauto.main(config)
+    return 0
+
+
+def bench(args):
+    if args.benchmark == "forms":
+        import bench_forms
+        bench_forms.main(args.bench_args)
+    else:
+        import bench_driver
+        bench_driver.main(args.bench_args)
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="LinkedIn Easy Apply automation")
+    parser.add_argument("--config", default=CONFIG_FILE, help="path to config.json")
+    subcommands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subcommands.add_parser("run", help="run an application session")
+    run_parser.add_argument("--dry-run", action="store_true", help="only print the plan, like 'plan'")
+    run_parser.add_argument("--stage", choices=["discover", "apply", "both"],
+                            help="run as decoupled stages over the work queue instead of one session")
+    run_parser.add_argument("--workers", type=int, default=1, help="apply workers with --stage apply/both")
+    run_parser.add_argument("--drain", action="store_true", help="with --stage apply: stop once the queue is empty")
+
+    plan_parser = subcommands.add_parser("plan", help="print searches, budgets and cached candidates (no browser)")
+    plan_parser.add_argument("--candidates", type=int, default=10, help="queued and cached jobs to list")
+
+    subcommands.add_parser("stats", help="print search yield, learned timeouts, cache and queue state")
+
+    bench_parser = subcommands.add_parser("bench", help="run a benchmark")
+    bench_parser.add_argument("benchmark", choices=["forms", "driver"])
+    bench_parser.add_argument("bench_args", nargs=argparse.REMAINDER, help="arguments for the benchmark")
+
+    args = parser.parse_args(argv)
+    if args.command != "run" or args.dry_run:
+        logging.basicConfig(level=logging.WARNING, format='%(levelname)s - %(message)s')
+
+    if args.command == "bench":
+        return bench(args)
+    if args.command == "stats":
+        stats()
+        return 0
+
+    config = load_config(args.config)
+    if args.command == "plan" or args.dry_run:
+        plan(config, getattr(args, "candidates", 10))
+        return 0
+    return run(config, args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
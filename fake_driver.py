@@ -0,0 +1,688 @@
+"""In-process fake WebDriver over a static HTML DOM.
+
+Implements the slice of the Selenium driver and WebElement API that
+Linkedinauto.py uses (find_element(s) by CSS selector, XPath, ID, tag name,
+name and class name, get_attribute, is_displayed, is_selected, click,
+send_keys, text, and the few scripts it executes) on top of HTML fixtures
+parsed with the standard library. Every command is counted and can be slowed
+down by a simulated round-trip latency, so form-filling logic can be
+benchmarked on CPU and the number of driver round trips per code path can be
+asserted without a browser.
+
+Fixtures drive page changes with a few attributes on clickable elements:
+
+- data-fake-goto="page.html"  load another page from the driver's pages
+- data-fake-show="selector"   un-hide elements matching a CSS selector
+- data-fake-hide="selector"   hide elements matching a CSS selector
+"""
+import os
+import re
+from collections import Counter
+from html.parser import HTMLParser
+from time import sleep
+
+try:
+    from selenium.common.exceptions import (InvalidSelectorException, JavascriptException, NoSuchElementException,
+                                            StaleElementReferenceException)
+except ImportError:  # Selenium is not needed to exercise the fake driver
+    class InvalidSelectorException(Exception):
+        """The selector could not be parsed"""
+
+    class JavascriptException(Exception):
+        """The script could not be executed"""
+
+    class NoSuchElementException(Exception):
+        """No element matched the locator"""
+
+    class StaleElementReferenceException(Exception):
+        """The element belongs to a page that is no longer loaded"""
+
+VOID_ELEMENTS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "wbr"}
+NEVER_DISPLAYED = {"head", "script", "style", "template", "title", "noscript"}
+BOOLEAN_ATTRIBUTES = {"checked", "selected", "disabled", "readonly", "required", "multiple", "hidden"}
+
+# Scripts Linkedinauto.py runs purely for their side effects on a real page
+NO_OP_SCRIPTS = [re.compile(pattern) for pattern in (
+    r"^\s*arguments\[0\]\.scrollIntoView\(.*\);?\s*$",
+    r"^\s*window\.scrollTo\(.*\);?\s*$",
+)]
+
+
+class _Node:
+    __slots__ = ("tag", "attrs", "children", "parent", "order", "value", "checked", "selected")
+
+    def __init__(self, tag, attrs, parent):
+        self.tag = tag
+        self.attrs = attrs
+        self.children = []
+        self.parent = parent
+        self.order = 0
+        self.value = attrs.get("value", "")
+        self.checked = "checked" in attrs
+        self.selected = "selected" in attrs
+
+    def elements(self):
+        return [child for child in self.children if isinstance(child, _Node)]
+
+    def descendants(self):
+        stack = list(reversed(self.elements()))
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node.elements()))
+
+    def string_value(self):
+        """XPath string value: all descendant text in document order"""
+        return "".join(child if isinstance(child, str) else child.string_value() for child in self.children)
+
+    def first_text(self):
+        return next((child for child in self.children if isinstance(child, str)), "")
+
+
+class _DocumentBuilder(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.root = _Node("#document", {}, None)
+        self._stack = [self.root]
+
+    def handle_starttag(self, tag, attrs):
+        node = _Node(tag, {name: (value if value is not None else "") for name, value in attrs}, self._stack[-1])
+        self._stack[-1].children.append(node)
+        if tag not in VOID_ELEMENTS:
+            self._stack.append(node)
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_ELEMENTS:
+            self._stack.pop()
+
+    def handle_endtag(self, tag):
+        for depth in range(len(self._stack) - 1, 0, -1):
+            if self._stack[depth].tag == tag:
+                del self._stack[depth:]
+                return
+
+    def handle_data(self, data):
+        self._stack[-1].children.append(data)
+
+
+def parse_document(html):
+    builder = _DocumentBuilder()
+    builder.feed(html)
+    builder.close()
+    for order, node in enumerate(builder.root.descendants(), start=1):
+        node.order = order
+        if node.tag == "textarea":
+            node.value = node.string_value()
+    return builder.root
+
+
+# --- CSS selectors -------------------------------------------------------
+
+_IDENT = r"-?[_a-zA-Z][\w-]*"
+_ATTRIBUTE_PATTERN = re.compile(
+    r"\[\s*(" + _IDENT + r")\s*(?:([*^$~|]?=)\s*(?:'([^']*)'|\"([^\"]*)\"|([^\]\s]+))\s*)?\]")
+
+
+def _split_top_level(text, separator):
+    parts, depth, quote, current = [], 0, None, ""
+    for char in text:
+        if quote:
+            quote = None if char == quote else quote
+        elif char in "'\"":
+            quote = char
+        elif char in "([":
+            depth += 1
+        elif char in ")]":
+            depth -= 1
+        elif char == separator and depth == 0:
+            parts.append(current)
+            current = ""
+            continue
+        current += char
+    parts.append(current)
+    return parts
+
+
+def _parse_compound(text, pos, selector):
+    compound = {"tag": None, "id": [], "class": [], "attrs": [], "not": []}
+    start = pos
+    while pos < len(text) and text[pos] not in " \t\n>+~,)":
+        match = re.match(r"\*|" + _IDENT, text[pos:])
+        if pos == start and match:
+            compound["tag"] = None if match.group(0) == "*" else match.group(0).lower()
+            pos += match.end()
+            continue
+        char = text[pos]
+        if char in "#." and re.match(_IDENT, text[pos + 1:]):
+            name = re.match(_IDENT, text[pos + 1:]).group(0)
+            compound["id" if char == "#" else "class"].append(name)
+            pos += 1 + len(name)
+        elif char == "[" and _ATTRIBUTE_PATTERN.match(text, pos):
+            match = _ATTRIBUTE_PATTERN.match(text, pos)
+            value = next((group for group in match.groups()[2:] if group is not None), None)
+            compound["attrs"].append((match.group(1).lower(), match.group(2), value))
+            pos = match.end()
+        elif text.startswith(":not(", pos):
+            inner, pos = _parse_compound(text, pos + 5, selector)
+            if pos >= len(text) or text[pos] != ")":
+                raise InvalidSelectorException(f"Invalid CSS selector: {selector}")
+            compound["not"].append(inner)
+            pos += 1
+        else:
+            raise InvalidSelectorException(f"Unsupported CSS selector: {selector}")
+    if pos == start:
+        raise InvalidSelectorException(f"Invalid CSS selector: {selector}")
+    return compound, pos
+
+
+def parse_css(selector):
+    """Parse a selector group into [[(combinator, compound), ...], ...]"""
+    group = []
+    for part in _split_top_level(selector, ","):
+        text = part.strip()
+        if not text:
+            raise InvalidSelectorException(f"Invalid CSS selector: {selector}")
+        steps, pos, combinator = [], 0, None
+        while pos < len(text):
+            compound, pos = _parse_compound(text, pos, selector)
+            steps.append((combinator, compound))
+            spaced = pos < len(text) and text[pos].isspace()
+            while pos < len(text) and text[pos].isspace():
+                pos += 1
+            if pos < len(text) and text[pos] == ">":
+                combinator = ">"
+                pos += 1
+                while pos < len(text) and text[pos].isspace():
+                    pos += 1
+            elif pos < len(text) and text[pos] in "+~)":
+                raise InvalidSelectorException(f"Unsupported CSS selector: {selector}")
+            elif spaced:
+                combinator = " "
+        group.append(steps)
+    return group
+
+
+def _matches_compound(node, compound):
+    if compound["tag"] and node.tag != compound["tag"]:
+        return False
+    if any(node.attrs.get("id") != element_id for element_id in compound["id"]):
+        return False
+    classes = node.attrs.get("class", "").split()
+    if any(name not in classes for name in compound["class"]):
+        return False
+    for name, operator, expected in compound["attrs"]:
+        if name not in node.attrs:
+            return False
+        actual = node.attrs[name]
+        if operator == "=" and actual != expected:
+            return False
+        if operator == "*=" and expected not in actual:
+            return False
+        if operator == "^=" and not actual.startswith(expected):
+            return False
+        if operator == "$=" and not actual.endswith(expected):
+            return False
+        if operator == "~=" and expected not in actual.split():
+            return False
+        if operator == "|=" and actual != expected and not actual.startswith(expected + "-"):
+            return False
+    return not any(_matches_compound(node, inner) for inner in compound["not"])
+
+
+def _matches_steps(node, steps, index):
+    combinator, compound = steps[index]
+    if not _matches_compound(node, compound):
+        return False
+    if index == 0:
+        return True
+    # Like querySelectorAll, ancestors may lie outside the element the search starts from
+    ancestor = node.parent
+    while ancestor is not None and ancestor.tag != "#document":
+        if _matches_steps(ancestor, steps, index - 1):
+            return True
+        if combinator == ">":
+            return False
+        ancestor = ancestor.parent
+    return False
+
+
+def select_css(scope, selector):
+    group = parse_css(selector)
+    return [node for node in scope.descendants() if any(_matches_steps(node, steps, len(steps) - 1)
+                                                        for steps in group)]
+
+
+# --- XPath ---------------------------------------------------------------
+
+_XPATH_TOKEN = re.compile(r"\s*(//|/|\[|\]|\(|\)|,|!=|=|@|\*|\.|'[^']*'|\"[^\"]*\"|[A-Za-z_][\w-]*(?:\(\))?)")
+
+
+class _XPathParser:
+    """Recursive-descent parser for the XPath subset used by the script"""
+
+    def __init__(self, expression):
+        self.expression = expression
+        self.tokens = []
+        pos = 0
+        while pos < len(expression.rstrip()):
+            match = _XPATH_TOKEN.match(expression, pos)
+            if not match:
+                raise InvalidSelectorException(f"Unsupported XPath: {expression}")
+            self.tokens.append(match.group(1))
+            pos = match.end()
+        self.pos = 0
+
+    def peek(self):
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else None
+
+    def take(self, expected=None):
+        token = self.peek()
+        if token is None or (expected is not None and token != expected):
+            raise InvalidSelectorException(f"Unsupported XPath: {self.expression}")
+        self.pos += 1
+        return token
+
+    def parse_path(self):
+        relative = self.peek() == "."
+        if relative:
+            self.take()
+        steps = []
+        while self.peek() in ("//", "/"):
+            axis = "descendant" if self.take() == "//" else "child"
+            name = self.take()
+            if name != "*" and not re.match(r"[A-Za-z_][\w-]*$", name):
+                raise InvalidSelectorException(f"Unsupported XPath: {self.expression}")
+            predicates = []
+            while self.peek() == "[":
+                self.take("[")
+                predicates.append(self.parse_or())
+                self.take("]")
+            steps.append((axis, name.lower(), predicates))
+        if not steps or self.peek() is not None:
+            raise InvalidSelectorException(f"Unsupported XPath: {self.expression}")
+        return relative, steps
+
+    def parse_or(self):
+        terms = [self.parse_and()]
+        while self.peek() == "or":
+            self.take()
+            terms.append(self.parse_and())
+        return ("or", terms) if len(terms) > 1 else terms[0]
+
+    def parse_and(self):
+        terms = [self.parse_atom()]
+        while self.peek() == "and":
+            self.take()
+            terms.append(self.parse_atom())
+        return ("and", terms) if len(terms) > 1 else terms[0]
+
+    def parse_atom(self):
+        token = self.peek()
+        if token in ("contains", "starts-with"):
+            self.take()
+            self.take("(")
+            value = self.parse_value()
+            self.take(",")
+            literal = self.parse_literal()
+            self.take(")")
+            return (token, value, literal)
+        if token == "not":
+            self.take()
+            self.take("(")
+            inner = self.parse_or()
+            self.take(")")
+            return ("not", inner)
+        if token == "(":
+            self.take()
+            inner = self.parse_or()
+            self.take(")")
+            return inner
+        value = self.parse_value()
+        if self.peek() in ("=", "!="):
+            operator = self.take()
+            return (operator, value, self.parse_literal())
+        return ("exists", value)
+
+    def parse_value(self):
+        token = self.take()
+        if token == ".":
+            return ("string",)
+        if token == "text()":
+            return ("text",)
+        if token == "@":
+            return ("attribute", self.take().lower())
+        if token == "normalize-space()":
+            return ("normalize", ("string",))
+        if token == "normalize-space":
+            self.take("(")
+            inner = self.parse_value()
+            self.take(")")
+            return ("normalize", inner)
+        raise InvalidSelectorException(f"Unsupported XPath: {self.expression}")
+
+    def parse_literal(self):
+        token = self.take()
+        if token[0] not in "'\"":
+            raise InvalidSelectorException(f"Unsupported XPath: {self.expression}")
+        return token[1:-1]
+
+
+def _xpath_value(node, value):
+    kind = value[0]
+    if kind == "string":
+        return node.string_value()
+    if kind == "text":
+        return node.first_text()
+    if kind == "attribute":
+        return node.attrs.get(value[1])
+    return " ".join((_xpath_value(node, value[1]) or "").split())
+
+
+def _xpath_test(node, predicate):
+    kind = predicate[0]
+    if kind == "or":
+        return any(_xpath_test(node, term) for term in predicate[1])
+    if kind == "and":
+        return all(_xpath_test(node, term) for term in predicate[1])
+    if kind == "not":
+        return not _xpath_test(node, predicate[1])
+    if kind == "exists":
+        return bool(_xpath_value(node, predicate[1]))
+    actual = _xpath_value(node, predicate[1])
+    if actual is None:
+        return False
+    if kind == "contains":
+        return predicate[2] in actual
+    if kind == "starts-with":
+        return actual.startswith(predicate[2])
+    if kind == "=":
+        return actual == predicate[2]
+    return actual != predicate[2]
+
+
+def select_xpath(scope, expression):
+    relative, steps = _XPathParser(expression).parse_path()
+    if not relative:
+        while scope.parent is not None:
+            scope = scope.parent
+    context = [scope]
+    for axis, name, predicates in steps:
+        found = {}
+        for node in context:
+            candidates = node.descendants() if axis == "descendant" else node.elements()
+            for candidate in candidates:
+                if (name == "*" or candidate.tag == name) and all(_xpath_test(candidate, predicate)
+                                                                   for predicate in predicates):
+                    found[candidate.order] = candidate
+        context = [found[order] for order in sorted(found)]
+    return context
+
+
+# --- Driver ----------------------------------------------------------------
+
+def _is_displayed(node):
+    if node.tag == "input" and node.attrs.get("type", "").lower() == "hidden":
+        return False
+    while node is not None and node.tag != "#document":
+        if node.tag in NEVER_DISPLAYED or "hidden" in node.attrs:
+            return False
+        style = node.attrs.get("style", "").replace(" ", "").lower()
+        if "display:none" in style or "visibility:hidden" in style:
+            return False
+        node = node.parent
+    return True
+
+
+def _visible_text(node):
+    parts = []
+    for child in node.children:
+        if isinstance(child, str):
+            parts.append(child)
+        elif _is_displayed(child):
+            parts.append(_visible_text(child))
+    return " ".join(" ".join(parts).split())
+
+
+class FakeElement:
+    """WebElement stand-in bound to a node of the fake driver's current page"""
+
+    def __init__(self, driver, node, generation):
+        self._driver = driver
+        self._node = node
+        self._generation = generation
+
+    def _command(self, name):
+        self._driver._command(name)
+        if self._generation != self._driver._generation:
+            raise StaleElementReferenceException("Element is not attached to the current page")
+        return self._node
+
+    @property
+    def text(self):
+        node = self._command("getElementText")
+        return _visible_text(node) if _is_displayed(node) else ""
+
+    @property
+    def tag_name(self):
+        return self._command("getElementTagName").tag
+
+    def get_attribute(self, name):
+        node = self._command("getElementAttribute")
+        name = name.lower()
+        if name == "value":
+            return node.value
+        if name == "checked":
+            return "true" if node.checked else None
+        if name == "selected":
+            return "true" if node.selected else None
+        if name == "type" and node.tag == "input":
+            return node.attrs.get("type", "text").lower()
+        if name in BOOLEAN_ATTRIBUTES:
+            return "true" if name in node.attrs else None
+        return node.attrs.get(name)
+
+    def is_displayed(self):
+        return _is_displayed(self._command("isElementDisplayed"))
+
+    def is_selected(self):
+        node = self._command("isElementSelected")
+        return node.selected if node.tag == "option" else node.checked
+
+    def is_enabled(self):
+        return "disabled" not in self._command("isElementEnabled").attrs
+
+    def click(self):
+        self._driver._click(self._command("clickElement"))
+
+    def send_keys(self, *values):
+        node = self._command("sendKeysToElement")
+        node.value += "".join(str(value) for value in values)
+
+    def clear(self):
+        self._command("clearElement").value = ""
+
+    def find_elements(self, by, value):
+        return self._driver._find(self._command("findChildElements"), by, value)
+
+    def find_element(self, by, value):
+        elements = self._driver._find(self._command("findChildElement"), by, value)
+        if not elements:
+            raise NoSuchElementException(f"No element found for {by}={value}")
+        return elements[0]
+
+
+class _SwitchTo:
+    def __init__(self, driver):
+        self._driver = driver
+
+    def window(self, handle):
+        self._driver._command("switchToWindow")
+
+    def new_window(self, type_hint="tab"):
+        self._driver._command("newWindow")
+
+
+class FakeDriver:
+    """WebDriver stand-in over static HTML pages with per-command latency and counting"""
+
+    def __init__(self, pages, start_page=None, latency=0.0):
+        """`pages` maps page names (used as URLs) to HTML; `latency` is seconds added to every command"""
+        self.pages = dict(pages)
+        self.latency = latency
+        self.command_counts = Counter()
+        self.scripts = []
+        self.switch_to = _SwitchTo(self)
+        self.current_url = None
+        self._document = None
+        self._generation = 0
+        self._load(start_page or next(iter(self.pages)))
+
+    @classmethod
+    def from_files(cls, *paths, latency=0.0):
+        """Load fixtures from disk; each page is named after its file name"""
+        pages = {}
+        for path in paths:
+            with open(path, encoding="utf-8") as f:
+                pages[os.path.basename(path)] = f.read()
+        return cls(pages, latency=latency)
+
+    @property
+    def command_total(self):
+        return sum(self.command_counts.values())
+
+    def reset_counts(self):
+        self.command_counts.clear()
+        self.scripts.clear()
+
+    def _command(self, name):
+        self.command_counts[name] += 1
+        if self.latency:
+            sleep(self.latency)
+
+    def _load(self, page):
+        if page not in self.pages:
+            page = os.path.basename(page.split("?")[0].rstrip("/"))
+        if page not in self.pages:
+            raise ValueError(f"FakeDriver has no page named {page}")
+        self._document = parse_document(self.pages[page])
+        self._generation += 1
+        self.current_url = page
+
+    def _find(self, scope, by, value):
+        if by == "css selector":
+            nodes = select_css(scope, value)
+        elif by == "xpath":
+            nodes = select_xpath(scope, value)
+        elif by == "id":
+            nodes = [node for node in scope.descendants() if node.attrs.get("id") == value]
+        elif by == "name":
+            nodes = [node for node in scope.descendants() if node.attrs.get("name") == value]
+        elif by == "class name":
+            nodes = [node for node in scope.descendants() if value in node.attrs.get("class", "").split()]
+        elif by == "tag name":
+            nodes = [node for node in scope.descendants() if node.tag == value.lower()]
+        else:
+            raise InvalidSelectorException(f"Unsupported locator strategy: {by}")
+        generation = self._generation
+        return [FakeElement(self, node, generation) for node in nodes]
+
+    def _click(self, node):
+        if "disabled" in node.attrs:
+            return
+        if node.tag == "label" and node.attrs.get("for"):
+            target = [n for n in self._document.descendants() if n.attrs.get("id") == node.attrs["for"]]
+            if target:
+                node = target[0]
+        input_type = node.attrs.get("type", "").lower()
+        if node.tag == "input" and input_type == "radio":
+            name = node.attrs.get("name")
+            for other in self._document.descendants():
+                if other.tag == "input" and other.attrs.get("type", "").lower() == "radio" \
+                        and name and other.attrs.get("name") == name:
+                    other.checked = False
+            node.checked = True
+        elif node.tag == "input" and input_type == "checkbox":
+            node.checked = not node.checked
+        elif node.tag == "option":
+            select = node.parent
+            while select is not None and select.tag != "select":
+                select = select.parent
+            for option in (select.descendants() if select else []):
+                if option.tag == "option":
+                    option.selected = False
+            node.selected = True
+
+        # Walk up so clicks on a button's inner span trigger the button's behaviour
+        actor = node
+        while actor is not None and not any(name in actor.attrs for name in
+                                            ("data-fake-goto", "data-fake-show", "data-fake-hide")):
+            actor = actor.parent
+        if actor is None:
+            return
+        for selector in actor.attrs.get("data-fake-hide", "").split(";"):
+            for target in (select_css(self._document, selector) if selector.strip() else []):
+                target.attrs["hidden"] = ""
+        for selector in actor.attrs.get("data-fake-show", "").split(";"):
+            for target in (select_css(self._document, selector) if selector.strip() else []):
+                target.attrs.pop("hidden", None)
+        if actor.attrs.get("data-fake-goto"):
+            self._load(actor.attrs["data-fake-goto"])
+
+    # Selenium-compatible driver API
+
+    def get(self, url):
+        self._command("get")
+        self._load(url)
+
+    def find_elements(self, by, value):
+        self._command("findElements")
+        return self._find(self._document, by, value)
+
+    def find_element(self, by, value):
+        self._command("findElement")
+        elements = self._find(self._document, by, value)
+        if not elements:
+            raise NoSuchElementException(f"No element found for {by}={value}")
+        return elements[0]
+
+    def execute_script(self, script, *args):
+        self._command("executeScript")
+        self.scripts.append(script)
+        if any(pattern.match(script) for pattern in NO_OP_SCRIPTS):
+            return None
+        if script.strip() in ("return document.readyState", "return document.readyState;"):
+            return "complete"
+        raise JavascriptException(f"FakeDriver does not emulate script: {script}")
+
+    def execute_cdp_cmd(self, cmd, cmd_args=None):
+        self._command("executeCdpCommand")
+        if cmd == "Runtime.getHeapUsage":
+            return {"usedSize": 0, "totalSize": 0}
+        if cmd == "Network.getAllCookies":
+            return {"cookies": []}
+        return {}
+
+    def save_screenshot(self, filename):
+        self._command("screenshot")
+        return True
+
+    def maximize_window(self):
+        self._command("maximizeWindow")
+
+    def set_page_load_timeout(self, timeout):
+        self._command("setTimeouts")
+
+    @property
+    def window_handles(self):
+        return ["fake-window"]
+
+    @property
+    def current_window_handle(self):
+        return "fake-window"
+
+    def close(self):
+        self._command("closeWindow")
+
+    def quit(self):
+        self._command("quit")
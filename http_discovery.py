@@ -0,0 +1,358 @@
+"""Browserless job discovery over a pooled keep-alive HTTP client.
+
+Fetches LinkedIn's job search result fragments directly instead of rendering
+the search SPA in Chrome, reusing the browser session's cookies. Only the job
+IDs are handed back to the browser for the Easy Apply step.
+
+Uses urllib3 (already installed with Selenium) for connection pooling and
+lxml for parsing when available, falling back to the standard library parser.
+
+To try it against a local stand-in serving recorded result pages:
+
+    python http_discovery.py --serve fixtures --keywords "Python Developer" --location "New York"
+"""
+import argparse
+import logging
+import os
+import re
+import threading
+import urllib.parse
+from html.parser import HTMLParser
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import urllib3
+
+try:
+    import lxml.html
+except ImportError:  # The standard library parser is slower but has the same output
+    lxml = None
+
+logger = logging.getLogger()
+
+DEFAULT_BASE_URL = "https://www.linkedin.com"
+SEARCH_PATH = "/jobs-guest/jobs/api/seeMoreJobPostings/search"
+JOB_POSTING_PATH = "/jobs-guest/jobs/api/jobPosting/{job_id}"
+RESULTS_PER_PAGE = 25
+DEFAULT_USER_AGENT = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                      "(KHTML, like Gecko) Chrome/135.0.7049.86 Safari/537.36")
+JOB_URN_PATTERN = re.compile(r"urn:li:jobPosting:(\d+)")
+
+# Class names of the fields on each result card
+TITLE_CLASS = "base-search-card__title"
+COMPANY_CLASS = "base-search-card__subtitle"
+LOCATION_CLASS = "job-search-card__location"
+LINK_CLASS = "base-card__full-link"
+
+# Class names of the fields on a job posting page
+POSTING_CLASSES = {
+    "title": "top-card-layout__title",
+    "company": "topcard__org-name-link",
+    "location": "topcard__flavor--bullet",
+    "description": "show-more-less-html__markup"
+}
+EASY_APPLY_MARKERS = ("apply-link-onsite",)  # Control names only; "Easy Apply" also appears in page text
+EXTERNAL_APPLY_MARKER = "apply-link-offsite"
+
+
+class DiscoverySession:
+    """Pooled keep-alive HTTP client carrying the browser session's cookies"""
+
+    def __init__(self, base_url=DEFAULT_BASE_URL, cookies=None, pool_size=4, user_agent=DEFAULT_USER_AGENT):
+        self.base_url = base_url.rstrip("/")
+        self.cookies = dict(cookies or {})
+        self.user_agent = user_agent
+        self.pool = urllib3.PoolManager(
+            num_pools=2,
+            maxsize=pool_size,
+            block=True,
+            retries=urllib3.Retry(total=3, backoff_factor=1, status_forcelist=[429, 500, 502, 503, 504]),
+            timeout=urllib3.Timeout(connect=5, read=15)
+        )
+
+    @classmethod
+    def from_driver(cls, driver, base_url=DEFAULT_BASE_URL, **kwargs):
+        """Create a session that shares the logged-in browser's LinkedIn cookies"""
+        cookies = driver.execute_cdp_cmd("Network.getAllCookies", {})["cookies"]
+        host = urllib.parse.urlparse(base_url).hostname or ""
+        shared = {cookie["name"]: cookie["value"] for cookie in cookies
+                  if host == cookie["domain"].lstrip(".") or host.endswith("." + cookie["domain"].lstrip("."))}
+        logger.info(f"Sharing {len(shared)} browser cookies with the discovery client")
+        return cls(base_url, shared, **kwargs)
+
+    def get(self, path, params=None):
+        """GET a path relative to the base URL and return the decoded body, or None on a non-200 reply"""
+        url = self.base_url + path
+        if params:
+            url += "?" + urllib.parse.urlencode(params)
+        headers = {"User-Agent": self.user_agent, "Accept": "text/html,*/*"}
+        if self.cookies:
+            headers["Cookie"] = "; ".join(f"{name}={value}" for name, value in self.cookies.items())
+        response = self.pool.request("GET", url, headers=headers)
+        if response.status != 200:
+            logger.warning(f"Discovery request returned HTTP {response.status}: {url}")
+            return None
+        return response.data.decode("utf-8", errors="replace")
+
+    def close(self):
+        self.pool.clear()
+
+
+def _clean(text):
+    return " ".join(text.split()) if text else None
+
+
+def _job_id(urn):
+    match = JOB_URN_PATTERN.search(urn or "")
+    return match.group(1) if match else None
+
+
+def _parse_with_lxml(html):
+    postings = []
+    document = lxml.html.fromstring(html)
+    for card in document.xpath("//*[contains(@data-entity-urn, 'urn:li:jobPosting:')]"):
+        def field(class_name):
+            nodes = card.xpath(f".//*[contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')]")
+            return nodes[0] if len(nodes) else None
+
+        title, company, location, link = (field(TITLE_CLASS), field(COMPANY_CLASS),
+                                          field(LOCATION_CLASS), field(LINK_CLASS))
+        postings.append({
+            "job_id": _job_id(card.get("data-entity-urn")),
+            "title": _clean(title.text_content()) if title is not None else None,
+            "company": _clean(company.text_content()) if company is not None else None,
+            "location": _clean(location.text_content()) if location is not None else None,
+            "url": link.get("href") if link is not None else None
+        })
+    return postings
+
+
+class _ResultCardParser(HTMLParser):
+    """Standard library fallback that extracts the same fields as the lxml path"""
+
+    VOID_ELEMENTS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "wbr"}
+    FIELDS = {TITLE_CLASS: "title", COMPANY_CLASS: "company", LOCATION_CLASS: "location"}
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.postings = []
+        self._card = None
+        self._card_depth = None
+        self._field_stack = []  # (depth, field name) for fields currently being read
+        self._depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.VOID_ELEMENTS:
+            return
+        self._depth += 1
+        attrs = dict(attrs)
+        classes = (attrs.get("class") or "").split()
+
+        job_id = _job_id(attrs.get("data-entity-urn"))
+        if job_id and self._card is None:
+            self._card = {"job_id": job_id, "title": None, "company": None, "location": None, "url": None}
+            self._card_depth = self._depth
+        if self._card is None:
+            return
+
+        if LINK_CLASS in classes and not self._card["url"]:
+            self._card["url"] = attrs.get("href")
+        for class_name, field in self.FIELDS.items():
+            if class_name in classes and self._card[field] is None:
+                self._card[field] = ""
+                self._field_stack.append((self._depth, field))
+
+    def handle_endtag(self, tag):
+        if tag in self.VOID_ELEMENTS:
+            return
+        while self._field_stack and self._field_stack[-1][0] >= self._depth:
+            depth, field = self._field_stack.pop()
+            self._card[field] = _clean(self._card[field])
+        if self._card is not None and self._depth <= self._card_depth:
+            self.postings.append(self._card)
+            self._card = None
+        self._depth -= 1
+
+    def handle_data(self, data):
+        for _, field in self._field_stack:
+            self._card[field] += data
+
+
+class _FieldTextParser(HTMLParser):
+    """Standard library fallback collecting the text of the first element with each class"""
+
+    VOID_ELEMENTS = _ResultCardParser.VOID_ELEMENTS
+
+    def __init__(self, fields):
+        super().__init__(convert_charrefs=True)
+        self.fields = fields
+        self.values = {key: None for key in fields}
+        self._open = []  # (depth, key) of fields currently being read
+        self._depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.VOID_ELEMENTS:
+            return
+        self._depth += 1
+        classes = (dict(attrs).get("class") or "").split()
+        for key, class_name in self.fields.items():
+            if class_name in classes and self.values[key] is None:
+                self.values[key] = ""
+                self._open.append((self._depth, key))
+
+    def handle_endtag(self, tag):
+        if tag in self.VOID_ELEMENTS:
+            return
+        while self._open and self._open[-1][0] >= self._depth:
+            _, key = self._open.pop()
+            self.values[key] = _clean(self.values[key])
+        self._depth -= 1
+
+    def handle_data(self, data):
+        for _, key in self._open:
+            self.values[key] += data
+
+
+def parse_job_details(html):
+    """Parse a job posting page into {title, company, location, description, easy_apply}"""
+    if lxml is not None:
+        document = lxml.html.fromstring(html)
+        details = {}
+        for key, class_name in POSTING_CLASSES.items():
+            nodes = document.xpath(f"//*[contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')]")
+            details[key] = _clean(nodes[0].text_content()) if len(nodes) else None
+    else:
+        parser = _FieldTextParser(POSTING_CLASSES)
+        parser.feed(html)
+        parser.close()
+        details = parser.values
+
+    # None means the page does not say, so the browser has to check
+    if any(marker in html for marker in EASY_APPLY_MARKERS):
+        details["easy_apply"] = True
+    elif EXTERNAL_APPLY_MARKER in html:
+        details["easy_apply"] = False
+    else:
+        details["easy_apply"] = None
+    return details
+
+
+def fetch_job_details(session, job_id):
+    """Fetch and parse a job's posting page, or return None if it could not be loaded"""
+    html = session.get(JOB_POSTING_PATH.format(job_id=job_id))
+    if not html:
+        return None
+    details = parse_job_details(html)
+    details["job_id"] = job_id
+    return details
+
+
+def parse_job_postings(html):
+    """Parse a search result fragment into [{job_id, title, company, location, url}, ...]"""
+    if not html or not html.strip():
+        return []
+    if lxml is not None:
+        return _parse_with_lxml(html)
+    parser = _ResultCardParser()
+    parser.feed(html)
+    parser.close()
+    return parser.postings
+
+
+def iter_job_postings(session, keywords, location, max_pages=None, easy_apply=True):
+    """Yield the new postings of each result page, fetching a page only when the previous one is used up"""
+    seen = set()
+    start = 0
+    pages = 0
+    while max_pages is None or pages < max_pages:
+        params = {"keywords": keywords, "location": location, "start": start}
+        if easy_apply:
+            params["f_AL"] = "true"
+        try:
+            html = session.get(SEARCH_PATH, params)
+        except urllib3.exceptions.HTTPError as e:
+            logger.error(f"Discovery request failed: {str(e)}")
+            return
+        page = parse_job_postings(html)
+        if not page:
+            return
+        pages += 1
+        start += len(page)
+        postings = [posting for posting in page if posting["job_id"] and posting["job_id"] not in seen]
+        seen.update(posting["job_id"] for posting in postings)
+        logger.info(f"Discovered {len(postings)} postings for '{keywords}' in '{location}' over HTTP (page {pages})")
+        yield postings
+
+
+def fetch_job_postings(session, keywords, location, max_results=RESULTS_PER_PAGE, easy_apply=True):
+    """Fetch result pages until `max_results` unique postings are found or results run out"""
+    postings = []
+    for page in iter_job_postings(session, keywords, location, easy_apply=easy_apply):
+        postings.extend(page)
+        if len(postings) >= max_results:
+            break
+    return postings[:max_results]
+
+
+class _RecordedPageHandler(BaseHTTPRequestHandler):
+    """Serves search_start_<N>.html and job_posting_<ID>.html from a directory"""
+
+    directory = "fixtures"
+
+    def do_GET(self):
+        url = urllib.parse.urlparse(self.path)
+        posting_prefix = JOB_POSTING_PATH.format(job_id="")
+        if url.path.startswith(posting_prefix):
+            path = os.path.join(self.directory, f"job_posting_{url.path[len(posting_prefix):]}.html")
+            missing_status = 404
+        elif url.path == SEARCH_PATH:
+            start = urllib.parse.parse_qs(url.query).get("start", ["0"])[0]
+            path = os.path.join(self.directory, f"search_start_{start}.html")
+            missing_status = 200  # LinkedIn answers past the last page with an empty fragment
+        else:
+            path, missing_status = None, 404
+
+        status, body = missing_status, b""
+        if path and os.path.exists(path):
+            with open(path, "rb") as f:
+                status, body = 200, f.read()
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug(f"Stand-in server: {format % args}")
+
+
+def serve_recorded_pages(directory, port=0):
+    """Start a local stand-in for the search and job posting endpoints; returns the server (use server.shutdown())"""
+    handler = type("RecordedPageHandler", (_RecordedPageHandler,), {"directory": directory})
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Discover job postings over HTTP")
+    parser.add_argument("--keywords", default="Python Developer")
+    parser.add_argument("--location", default="New York")
+    parser.add_argument("--max-results", type=int, default=RESULTS_PER_PAGE)
+    parser.add_argument("--serve", metavar="DIR", help="serve recorded pages from DIR and search against them")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    server = serve_recorded_pages(args.serve) if args.serve else None
+    base_url = f"http://127.0.0.1:{server.server_address[1]}" if server else DEFAULT_BASE_URL
+    session = DiscoverySession(base_url)
+    try:
+        for posting in fetch_job_postings(session, args.keywords, args.location, args.max_results):
+            print(f"{posting['job_id']}\t{posting['title']}\t{posting['company']}\t{posting['location']}")
+    finally:
+        session.close()
+        if server:
+            server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
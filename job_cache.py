@@ -0,0 +1,133 @@
+"""Local cache of parsed job details keyed by job ID.
+
+Stores title, company, location, description and the Easy Apply flag with
+the time they were fetched in a SQLite file, so a posting's details pane is
+loaded at most once per TTL across searches and sessions. Entries older
+than the TTL are ignored and pruned, and the oldest entries are evicted
+once the cache holds more than its size cap. Later fetches fill in fields
+an earlier one could not read instead of overwriting them with blanks.
+"""
+import logging
+import sqlite3
+import threading
+import time
+
+logger = logging.getLogger()
+
+DETAIL_FIELDS = ("title", "company", "location", "description", "easy_apply")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS job_details (
+    job_id TEXT PRIMARY KEY,
+    title TEXT,
+    company TEXT,
+    location TEXT,
+    description TEXT,
+    easy_apply INTEGER,
+    fetched_at REAL NOT NULL
+)
+"""
+INDEX = "CREATE INDEX IF NOT EXISTS job_details_fetched_at ON job_details (fetched_at)"
+
+
+class JobDetailsCache:
+    """SQLite-backed job details with a TTL and a size cap; a no-op until opened"""
+
+    def __init__(self, ttl_seconds=72 * 3600, max_entries=5000):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._connection = None
+        self._lock = threading.Lock()
+
+    def open(self, path):
+        """Open (or create) the cache file and drop expired entries"""
+        self.close()
+        try:
+            # The prefetch thread reads and writes through the same connection, guarded by the lock
+            self._connection = sqlite3.connect(path, check_same_thread=False)
+            with self._lock, self._connection:
+                self._connection.execute(SCHEMA)
+                self._connection.execute(INDEX)
+                expired = self._connection.execute("DELETE FROM job_details WHERE fetched_at < ?",
+                                                   (time.time() - self.ttl_seconds,)).rowcount
+            logger.info(f"Job details cache {path}: {len(self)} entries, {expired} expired entries dropped")
+        except sqlite3.Error as e:
+            logger.warning(f"Could not open job details cache {path}: {str(e)}")
+            self._connection = None
+
+    def __len__(self):
+        if self._connection is None:
+            return 0
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM job_details").fetchone()[0]
+
+    def get(self, job_id):
+        """Cached details of a job if they are younger than the TTL, else None"""
+        if self._connection is None or not job_id:
+            return None
+        with self._lock:
+            row = self._connection.execute(
+                f"SELECT {', '.join(DETAIL_FIELDS)}, fetched_at FROM job_details WHERE job_id = ? AND fetched_at >= ?",
+                (job_id, time.time() - self.ttl_seconds)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        details = dict(zip(DETAIL_FIELDS, row[:-1]))
+        details["easy_apply"] = None if details["easy_apply"] is None else bool(details["easy_apply"])
+        details["job_id"] = job_id
+        details["fetched_at"] = row[-1]
+        return details
+
+    def put(self, job_id, details):
+        """Store a job's details, keeping previously cached values for fields that are missing now"""
+        if self._connection is None or not job_id or not details:
+            return
+        easy_apply = details.get("easy_apply")
+        values = [details.get(field) for field in DETAIL_FIELDS[:-1]] + [None if easy_apply is None else int(easy_apply)]
+        try:
+            with self._lock, self._connection:
+                self._connection.execute(
+                    f"INSERT INTO job_details (job_id, {', '.join(DETAIL_FIELDS)}, fetched_at) "
+                    f"VALUES (?, ?, ?, ?, ?, ?, ?) ON CONFLICT (job_id) DO UPDATE SET "
+                    + ", ".join(f"{field} = COALESCE(excluded.{field}, {field})" for field in DETAIL_FIELDS)
+                    + ", fetched_at = excluded.fetched_at",
+                    [job_id] + values + [time.time()])
+                self._connection.execute(
+                    "DELETE FROM job_details WHERE job_id IN "
+                    "(SELECT job_id FROM job_details ORDER BY fetched_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,))
+        except sqlite3.Error as e:
+            logger.warning(f"Could not cache details of job {job_id}: {str(e)}")
+
+    def candidates(self, limit=10):
+        """Most recently fetched fresh jobs that are not known to lack Easy Apply"""
+        if self._connection is None:
+            return []
+        with self._lock:
+            rows = self._connection.execute(
+                f"SELECT job_id, {', '.join(DETAIL_FIELDS)} FROM job_details "
+                f"WHERE fetched_at >= ? AND (easy_apply IS NULL OR easy_apply = 1) ORDER BY fetched_at DESC LIMIT ?",
+                (time.time() - self.ttl_seconds, limit)).fetchall()
+        candidates = [dict(zip(("job_id",) + DETAIL_FIELDS, row)) for row in rows]
+        for details in candidates:
+            details["easy_apply"] = None if details["easy_apply"] is None else bool(details["easy_apply"])
+        return candidates
+
+    def cached_fetch(self, fetch_details):
+        """Wrap a `fetch_details(job_id, cancelled)` function so it reads from and fills the cache"""
+        def fetch(job_id, cancelled):
+            details = self.get(job_id)
+            if details is None:
+                details = fetch_details(job_id, cancelled)
+                self.put(job_id, details)
+            return details
+        return fetch
+
+    def close(self):
+        if self._connection is not None:
+            with self._lock:
+                self._connection.close()
+            self._connection = None
@@ -0,0 +1,88 @@
+"""One-ahead prefetch of job details while the current application is filled in.
+
+`JobPrefetcher` runs a fetch function for the next candidate on a background
+thread, so its details are usually ready by the time the apply loop reaches
+it. Finished prefetches are handed over with `take`, and prefetches for jobs
+the loop skips are cancelled. The fetch function decides where details come
+from: a background tab on the CDP backend, or the HTTP discovery session.
+"""
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+
+logger = logging.getLogger()
+
+
+class JobPrefetcher:
+    """Fetch job details one job ahead of the apply loop"""
+
+    def __init__(self, fetch_details, close=None):
+        """`fetch_details(job_id, cancelled)` returns a details dict; it should return early once
+        the `cancelled` event is set. `close` releases whatever the fetcher holds (e.g. its tab)."""
+        self._fetch_details = fetch_details
+        self._close = close
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="job-prefetch")
+        self._pending = {}  # job_id -> (future, cancelled event)
+        self.hits = 0
+        self.misses = 0
+        self.cancelled = 0
+
+    def _run(self, job_id, cancelled):
+        if cancelled.is_set():
+            return None
+        try:
+            return self._fetch_details(job_id, cancelled)
+        except Exception as e:
+            logger.warning(f"Prefetch of job {job_id} failed: {str(e)}")
+            return None
+
+    def prefetch(self, job_id):
+        """Start loading a job's details in the background"""
+        if not job_id or job_id in self._pending:
+            return
+        cancelled = threading.Event()
+        self._pending[job_id] = (self._executor.submit(self._run, job_id, cancelled), cancelled)
+        logger.debug(f"Prefetching details for job {job_id}")
+
+    def take(self, job_id, timeout=0):
+        """Return the prefetched details for a job, or None if they are not ready within `timeout` seconds"""
+        entry = self._pending.pop(job_id, None)
+        if entry is None:
+            self.misses += 1
+            return None
+        future, cancelled = entry
+        try:
+            details = future.result(timeout=timeout)
+        except TimeoutError:
+            cancelled.set()
+            future.cancel()
+            details = None
+        if details is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            logger.info(f"Using prefetched details for job {job_id}")
+        return details
+
+    def cancel(self, job_id):
+        """Drop the prefetch of a job the loop has decided to skip"""
+        entry = self._pending.pop(job_id, None)
+        if entry:
+            future, cancelled = entry
+            cancelled.set()
+            future.cancel()
+            self.cancelled += 1
+
+    def cancel_all(self):
+        for job_id in list(self._pending):
+            self.cancel(job_id)
+
+    def close(self):
+        self.cancel_all()
+        self._executor.shutdown(wait=True)
+        if self._close:
+            try:
+                self._close()
+            except Exception as e:
+                logger.debug(f"Error closing prefetcher: {str(e)}")
+        logger.info(f"Prefetch: {self.hits} hits, {self.misses} misses, {self.cancelled} cancelled")
@@ -0,0 +1,205 @@
+"""Browser memory watchdog with tab and browser recycling.
+
+Samples Chrome's browser/renderer resident memory and the page's JS heap
+through CDP, and recycles the tab (or the whole browser, carrying the session
+cookies over) once a configured limit is crossed. Every sample is appended to
+a JSON-lines file so memory growth can be read next to the session summary.
+
+Works with both driver backends: both expose `execute_cdp_cmd`, Selenium-style
+window handles, and the PID of the process that owns Chrome.
+"""
+import json
+import logging
+import os
+import time
+from datetime import datetime
+
+try:
+    import psutil
+except ImportError:  # Fall back to reading /proc directly
+    psutil = None
+
+logger = logging.getLogger()
+
+MB = 1024 * 1024
+DEFAULT_LIMITS_MB = {
+    "renderer_rss_mb": 1024,  # Recycle the tab when renderer processes grow past this
+    "js_heap_used_mb": 512,  # Recycle the tab when the page's JS heap grows past this
+    "browser_rss_mb": 2048  # Restart the browser when the remaining processes grow past this
+}
+TAB_LIMITS = ("renderer_rss_mb", "js_heap_used_mb")
+BROWSER_LIMITS = ("browser_rss_mb",)
+
+# CookieParam fields accepted by Network.setCookies
+COOKIE_FIELDS = ("name", "value", "domain", "path", "secure", "httpOnly", "sameSite", "expires", "priority",
+                 "sourceScheme", "sourcePort", "partitionKey")
+
+
+def _driver_root_pid(driver):
+    """PID of the process Chrome runs under (chromedriver for Selenium, Chrome itself for CDP)"""
+    process = getattr(driver, "process", None) or getattr(getattr(driver, "service", None), "process", None)
+    return process.pid if process else None
+
+
+def _process_tree(root_pid):
+    """Return [(cmdline, rss_bytes), ...] for the root process and all its descendants"""
+    if psutil:
+        try:
+            root = psutil.Process(root_pid)
+            tree = []
+            for process in [root] + root.children(recursive=True):
+                try:
+                    tree.append((" ".join(process.cmdline()), process.memory_info().rss))
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    continue
+            return tree
+        except psutil.NoSuchProcess:
+            return []
+
+    if not os.path.isdir("/proc"):
+        return []
+    children = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                # The command name may contain spaces, so split after its closing parenthesis
+                parent = int(f.read().rsplit(")", 1)[1].split()[1])
+            children.setdefault(parent, []).append(int(entry))
+        except (OSError, IndexError, ValueError):
+            continue
+
+    tree, stack = [], [root_pid]
+    while stack:
+        pid = stack.pop()
+        stack.extend(children.get(pid, []))
+        try:
+            with open(f"/proc/{pid}/cmdline", "rb") as f:
+                cmdline = f.read().replace(b"\0", b" ").decode(errors="replace")
+            with open(f"/proc/{pid}/statm") as f:
+                rss = int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+            tree.append((cmdline, rss))
+        except (OSError, IndexError, ValueError):
+            continue
+    return tree
+
+
+class MemoryWatchdog:
+    """Track browser memory and recycle the tab or browser when limits are crossed"""
+
+    def __init__(self, limits=None, samples_path="memory_samples.jsonl"):
+        self.limits = dict(DEFAULT_LIMITS_MB, **(limits or {}))
+        self.samples_path = samples_path
+        self.samples = []
+        self.tab_recycles = 0
+        self.browser_recycles = 0
+
+    def sample(self, driver, label=""):
+        """Record browser/renderer RSS and JS heap usage for the current tab"""
+        sample = {"timestamp": datetime.now().isoformat(timespec="seconds"), "label": label,
+                  "browser_rss_mb": None, "renderer_rss_mb": None,
+                  "js_heap_used_mb": None, "js_heap_total_mb": None}
+
+        root_pid = _driver_root_pid(driver)
+        if root_pid:
+            tree = _process_tree(root_pid)
+            renderer = sum(rss for cmdline, rss in tree if "--type=renderer" in cmdline)
+            # Everything else under the root except chromedriver itself: browser, GPU and utility processes
+            browser = sum(rss for cmdline, rss in tree
+                          if "--type=renderer" not in cmdline and "chromedriver" not in cmdline)
+            if tree:
+                sample["browser_rss_mb"] = round(browser / MB, 1)
+                sample["renderer_rss_mb"] = round(renderer / MB, 1)
+
+        try:
+            heap = driver.execute_cdp_cmd("Runtime.getHeapUsage", {})
+            sample["js_heap_used_mb"] = round(heap["usedSize"] / MB, 1)
+            sample["js_heap_total_mb"] = round(heap["totalSize"] / MB, 1)
+        except Exception as e:
+            logger.debug(f"Could not read JS heap usage: {str(e)}")
+
+        self.samples.append(sample)
+        if self.samples_path:
+            try:
+                with open(self.samples_path, "a") as f:
+                    f.write(json.dumps(sample) + "\n")
+            except OSError as e:
+                logger.warning(f"Could not record memory sample: {str(e)}")
+        return sample
+
+    def _exceeded(self, sample, keys):
+        return [f"{key}={sample[key]} > {self.limits[key]}"
+                for key in keys if sample.get(key) is not None and sample[key] > self.limits[key]]
+
+    def check_tab(self, driver, label=""):
+        """Sample memory and recycle the current tab if renderer or heap limits are crossed"""
+        sample = self.sample(driver, label)
+        exceeded = self._exceeded(sample, TAB_LIMITS)
+        if not exceeded:
+            return False
+        logger.warning(f"Memory limit crossed ({', '.join(exceeded)}), recycling tab")
+        try:
+            recycle_tab(driver)
+            self.tab_recycles += 1
+            return True
+        except Exception as e:
+            logger.error(f"Failed to recycle tab: {str(e)}")
+            return False
+
+    def check_browser(self, driver, driver_factory, label=""):
+        """Sample memory and restart the browser if its limit is crossed; returns the driver to keep using"""
+        sample = self.sample(driver, label)
+        exceeded = self._exceeded(sample, BROWSER_LIMITS)
+        if not exceeded:
+            return driver
+        logger.warning(f"Memory limit crossed ({', '.join(exceeded)}), restarting browser")
+        try:
+            new_driver = recycle_browser(driver, driver_factory)
+            self.browser_recycles += 1
+            return new_driver
+        except Exception as e:
+            logger.error(f"Failed to restart browser: {str(e)}")
+            return driver
+
+    def summary(self):
+        """Peak values and recycle counts for the session summary"""
+        summary = {"samples": len(self.samples), "tab_recycles": self.tab_recycles,
+                   "browser_recycles": self.browser_recycles}
+        for key in ("browser_rss_mb", "renderer_rss_mb", "js_heap_used_mb"):
+            values = [sample[key] for sample in self.samples if sample.get(key) is not None]
+            summary[f"peak_{key}"] = max(values) if values else None
+        return summary
+
+
+def recycle_tab(driver):
+    """Replace the current tab with a fresh one on the same URL; cookies live in the profile so they carry over"""
+    url = driver.current_url
+    old_handle = driver.current_window_handle
+    driver.switch_to.new_window("tab")
+    new_handle = driver.current_window_handle
+    driver.switch_to.window(old_handle)
+    driver.close()
+    driver.switch_to.window(new_handle)
+    driver.get(url)
+    logger.info("Recycled browser tab")
+
+
+def recycle_browser(driver, driver_factory):
+    """Quit the browser and start a new one with the same cookies, back on the same URL"""
+    url = driver.current_url
+    cookies = driver.execute_cdp_cmd("Network.getAllCookies", {})["cookies"]
+    driver.quit()
+
+    start = time.monotonic()
+    new_driver = driver_factory()
+    params = []
+    for cookie in cookies:
+        param = {field: cookie[field] for field in COOKIE_FIELDS if field in cookie}
+        if cookie.get("session") or param.get("expires", 0) < 0:
+            param.pop("expires", None)
+        params.append(param)
+    new_driver.execute_cdp_cmd("Network.setCookies", {"cookies": params})
+    new_driver.get(url)
+    logger.info(f"Restarted browser with {len(params)} cookies in {time.monotonic() - start:.1f}s")
+    return new_driver
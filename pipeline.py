@@ -0,0 +1,297 @@
+"""Discovery and Easy Apply as separate stages over a durable work queue.
+
+The discovery stage runs the planned searches and enqueues job IDs with
+their metadata; apply workers lease jobs from the queue and apply at their
+own pace. Either stage can run on its own, so discovery can fill the queue
+during quiet periods and applying can drain it later, and the number of
+apply workers is set independently of discovery.
+
+    python pipeline.py discover                # enqueue postings only
+    python pipeline.py apply --workers 2       # drain the queue with two browsers
+    python pipeline.py both                    # run both stages in one process
+"""
+import argparse
+import logging
+import random
+import threading
+import time
+
+import Linkedinauto
+from search_planner import plan_searches, result_pages
+from search_scheduler import SearchScheduler
+from settings import QUEUE_FILE, configure_logging, load_config, application_limit
+from work_queue import WorkQueue
+
+MAX_PENDING = 50  # Discovery pauses while this many jobs wait to be applied to
+BACKPRESSURE_WAIT = 30  # Seconds between checks while the queue is full
+IDLE_WAIT = 15  # Seconds an apply worker waits when the queue is empty
+LEASE_SECONDS = 600  # A job not finished within this time is handed to another worker
+
+logger = logging.getLogger()
+
+
+def discover_in_browser(driver, search, start=0):
+    """Postings from a rendered search page, as [{job_id, title, company, location}, ...]"""
+    if not Linkedinauto.search_jobs_directly(driver, search["keywords"], search["location"], start):
+        return []
+    postings = []
+    for job_card in Linkedinauto.get_job_listings(driver):
+        job_id = Linkedinauto.get_job_id(job_card)
+        if job_id:
+            lines = (job_card.text.splitlines() + [None, None, None])[:3]
+            postings.append({"job_id": job_id, "title": lines[0], "company": lines[1], "location": lines[2]})
+    return postings
+
+
+def discovery_pages(search, discovery_session=None, driver=None):
+    """Yield the postings of a planned search page by page, one page per search it covers at most"""
+    if discovery_session:
+        from http_discovery import iter_job_postings
+        yield from iter_job_postings(discovery_session, search["keywords"], search["location"],
+                                     max_pages=result_pages(search))
+        return
+    for page in range(result_pages(search)):
+        postings = discover_in_browser(driver, search, page * Linkedinauto.SEARCH_RESULTS_PER_PAGE)
+        if not postings:
+            return
+        yield postings
+
+
+def run_discovery(queue_path, discovery_session=None, driver=None, stop=None, wait_for_room=True, scheduler=None):
+    """Producer stage: run the planned searches best-yielding first and enqueue new postings.
+    A full queue pauses discovery while apply workers drain it, or ends it if `wait_for_room` is False."""
+    queue = WorkQueue(queue_path, LEASE_SECONDS, MAX_PENDING)
+    scheduler = scheduler or SearchScheduler(Linkedinauto.SEARCH_STATS_FILE)
+    stop = stop or threading.Event()
+
+    def has_room():
+        # Backpressure: let the apply stage catch up before queueing more
+        while not queue.has_room():
+            if not wait_for_room:
+                logger.info(f"Work queue is full ({MAX_PENDING} pending), stopping discovery; "
+                            f"'pipeline.py apply --drain' empties it")
+                return False
+            if stop.is_set():
+                return False
+            logger.info(f"Work queue is full ({MAX_PENDING} pending), pausing discovery")
+            stop.wait(BACKPRESSURE_WAIT)
+        return not stop.is_set()
+
+    try:
+        searches = sorted(plan_searches(Linkedinauto.JOB_SEARCHES), key=scheduler.expected_rate, reverse=True)
+        for search in searches:
+            if not has_room():
+                break
+
+            # Higher expected yield means earlier in the queue
+            priority = scheduler.expected_rate(search)
+            added = 0
+            found = 0
+            full = False
+            search_start = time.monotonic()
+            for postings in discovery_pages(search, discovery_session, driver):
+                found += len(postings)
+                for posting in postings:
+                    cached_details = Linkedinauto.job_cache.get(posting["job_id"])
+                    if cached_details and cached_details["easy_apply"] is False:
+                        continue
+                    if not has_room():
+                        full = True
+                        break
+                    payload = dict(posting, search={"keywords": search["keywords"], "location": search["location"]})
+                    added += queue.put(posting["job_id"], payload, priority)
+                if full:
+                    break
+            # Applications are added to the search's history by the apply workers
+            scheduler.record(search, {"postings_found": found}, time.monotonic() - search_start)
+            logger.info(f"Queued {added} new of {found} postings for '{search['keywords']}' "
+                        f"in '{search['location']}'")
+            if full:
+                break
+    except Exception as e:
+        logger.error(f"Discovery stage failed: {str(e)}")
+    finally:
+        queue.close()
+
+
+def start_browser():
+    """A logged-in driver, or None if login failed"""
+    driver = Linkedinauto.setup_driver()
+    if Linkedinauto.login_to_linkedin(driver):
+        return driver
+    driver.quit()
+    return None
+
+
+def browser_alive(driver):
+    try:
+        driver.current_url
+        return True
+    except Exception:
+        return False
+
+
+def run_apply_worker(queue_path, application_limit, session_start, discovery_done, stop=None, worker=1,
+                     scheduler=None):
+    """Consumer stage: lease jobs and apply to them in its own browser until the limit or an empty queue"""
+    queue = WorkQueue(queue_path, LEASE_SECONDS, MAX_PENDING)
+    scheduler = scheduler or SearchScheduler(Linkedinauto.SEARCH_STATS_FILE)
+    stop = stop or threading.Event()
+    driver = None
+    try:
+        driver = start_browser()
+        if not driver:
+            logger.error(f"Worker {worker}: failed to login to LinkedIn, stopping")
+            return
+
+        index = 0
+        while not stop.is_set():
+            applied_count = queue.applied_count(since=session_start)
+            if applied_count >= application_limit:
+                logger.info(f"Worker {worker}: reached the application limit of {application_limit}")
+                break
+            if applied_count + queue.in_flight_count() >= application_limit:
+                # Other workers' applications in progress may use up the rest of the limit
+                # (expired leases are not in progress; lease() hands those out again)
+                stop.wait(IDLE_WAIT)
+                continue
+            leased = queue.lease()
+            if leased is None:
+                if discovery_done.is_set():
+                    logger.info(f"Worker {worker}: work queue is empty")
+                    break
+                stop.wait(IDLE_WAIT)
+                continue
+
+            job_id, payload, attempt = leased
+            logger.info(f"\nWorker {worker}: applying to {payload.get('title')} at {payload.get('company')} "
+                        f"(job ID {job_id}, attempt {attempt})")
+            job_stats = {"attempted": 1}
+            job_start = time.monotonic()
+            try:
+                applied = Linkedinauto.apply_to_job_id(driver, job_id, index, Linkedinauto.job_cache.get(job_id),
+                                                       job_stats, raise_errors=True)
+            except Exception as e:
+                # Back to the queue; another attempt (possibly by another worker) follows
+                logger.error(f"Worker {worker}: error applying to job {job_id}: {str(e)}")
+                queue.release(job_id)
+                applied = None
+            if not applied and not browser_alive(driver):
+                # A dead browser fails every job, so retry this one in a fresh browser instead
+                logger.error(f"Worker {worker}: browser stopped responding, restarting it")
+                if applied is not None:
+                    queue.release(job_id)
+                try:
+                    driver.quit()
+                except Exception:
+                    pass
+                driver = start_browser()
+                if not driver:
+                    logger.error(f"Worker {worker}: failed to login to LinkedIn, stopping")
+                    return
+                continue
+            if applied is None:
+                continue
+            queue.ack(job_id, applied)
+            if payload.get("search"):
+                # Feed the outcome back into the search's history, which orders what discovery queues next
+                job_stats["applied"] = int(bool(applied))
+                scheduler.record(payload["search"], job_stats, time.monotonic() - job_start, new_run=False)
+            index += 1
+
+            # Random wait between applications
+            stop.wait(random.uniform(*Linkedinauto.DELAY_BETWEEN_APPLICATIONS))
+    except Exception as e:
+        logger.error(f"Worker {worker} failed: {str(e)}")
+    finally:
+        queue.close()
+        if driver:
+            driver.quit()
+
+
+def run_pipeline(stage, workers=1, queue_path=QUEUE_FILE, drain=False, config=None):
+    """Run the discovery stage, the apply stage or both until they finish or are interrupted"""
+    if config is None:
+        config = load_config()
+    Linkedinauto.configure(config)
+    session_limit = application_limit(config, Linkedinauto.JOB_SEARCHES)
+    Linkedinauto.timeout_policy.load(Linkedinauto.TIMEOUT_PROFILE_FILE)
+    Linkedinauto.job_cache.open(Linkedinauto.JOB_CACHE_FILE)
+    session_start = time.time()
+    stop = threading.Event()
+    discovery_done = threading.Event()
+    scheduler = SearchScheduler(Linkedinauto.SEARCH_STATS_FILE)  # Shared, so the stages record into one history
+    if stage == "apply" and drain:
+        discovery_done.set()
+
+    threads = []
+    discovery_driver = None
+    discovery_session = None
+    try:
+        if stage in ("discover", "both"):
+            if Linkedinauto.DISCOVERY_MODE == "http":
+                # The guest search endpoints need no login, so discovery runs without a browser
+                from http_discovery import DiscoverySession
+                discovery_session = DiscoverySession()
+            else:
+                discovery_driver = Linkedinauto.setup_driver()
+                if not Linkedinauto.login_to_linkedin(discovery_driver):
+                    logger.error("Failed to login to LinkedIn, aborting discovery")
+                    return
+
+            def discover():
+                # Without apply workers in this process a full queue ends discovery instead of pausing it
+                run_discovery(queue_path, discovery_session, discovery_driver, stop, stage == "both", scheduler)
+                discovery_done.set()
+            threads.append(threading.Thread(target=discover, name="discovery"))
+
+        if stage in ("apply", "both"):
+            for worker in range(1, workers + 1):
+                threads.append(threading.Thread(
+                    target=run_apply_worker, name=f"apply-{worker}",
+                    args=(queue_path, session_limit, session_start, discovery_done, stop, worker, scheduler)))
+
+        for thread in threads:
+            thread.start()
+        while any(thread.is_alive() for thread in threads):
+            for thread in threads:
+                thread.join(timeout=1)
+            if stage == "both" and not any(thread.is_alive() for thread in threads[1:]):
+                # No worker left to drain the queue, so discovery would wait on backpressure forever
+                stop.set()
+    except KeyboardInterrupt:
+        logger.info("Stopping stages; leased jobs will be handed out again once their lease expires")
+        stop.set()
+        for thread in threads:
+            thread.join()
+    finally:
+        queue = WorkQueue(queue_path)
+        logger.info(f"Work queue: {queue.counts()}, {queue.applied_count(since=session_start)} applied this session")
+        queue.close()
+        Linkedinauto.timeout_policy.save()
+        Linkedinauto.job_cache.close()
+        if discovery_session:
+            discovery_session.close()
+        if discovery_driver:
+            discovery_driver.quit()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run discovery and Easy Apply as separate stages over a work queue")
+    parser.add_argument("stage", choices=["discover", "apply", "both"])
+    parser.add_argument("--workers", type=int, default=1, help="apply workers, each with its own browser")
+    parser.add_argument("--queue", default=QUEUE_FILE)
+    parser.add_argument("--drain", action="store_true",
+                        help="apply stage only: stop when the queue is empty instead of waiting for new jobs")
+    args = parser.parse_args(argv)
+
+    configure_logging()
+    config = load_config()
+    Linkedinauto.configure(config)
+    if not Linkedinauto.verify_linkedin_credentials():
+        return
+    run_pipeline(args.stage, args.workers, args.queue, args.drain, config)
+
+
+if __name__ == "__main__":
+    main()
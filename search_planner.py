@@ -0,0 +1,144 @@
+"""Search plan optimizer.
+
+Expands the configured keyword x location matrix and merges it into as few
+LinkedIn queries as possible without losing coverage:
+
+- a location is dropped for a keyword when a broader configured location
+  (e.g. "United States" for "New York") is already searched for it
+- keywords sharing a location are combined into one boolean query
+  ("Python Developer" OR "Backend Developer")
+
+Postings that show up in several result sets are deduplicated by job ID.
+A merged query reads one page of results per original search it covers, so
+merging never shrinks the pool of candidates, and the application budget is
+spread over the merged queries by the same measure.
+"""
+import logging
+
+logger = logging.getLogger()
+
+MAX_KEYWORDS_PER_QUERY = 3  # LinkedIn ranks long OR queries poorly, so keep groups small
+
+# Broader location containing each location; extend as new locations are configured
+LOCATION_PARENTS = {
+    "California": "United States",
+    "New York": "United States",
+    "New Jersey": "United States",
+    "Texas": "United States",
+    "Washington": "United States",
+    "Massachusetts": "United States",
+    "Illinois": "United States",
+    "San Francisco": "California",
+    "Los Angeles": "California",
+    "San Jose": "California",
+    "New York City": "New York",
+    "Brooklyn": "New York"
+}
+
+
+def expand_searches(keywords, locations):
+    """Expand keyword and location lists into one search per combination"""
+    return [{"keywords": keyword, "location": location} for keyword in keywords for location in locations]
+
+
+def _normalize(text):
+    return " ".join(text.split()).casefold()
+
+
+def _ancestors(location):
+    ancestors = []
+    parents = {_normalize(child): parent for child, parent in LOCATION_PARENTS.items()}
+    parent = parents.get(_normalize(location))
+    while parent and parent not in ancestors:
+        ancestors.append(parent)
+        parent = parents.get(_normalize(parent))
+    return ancestors
+
+
+def _keyword_query(keywords):
+    if len(keywords) == 1:
+        return keywords[0]
+    return " OR ".join(f'"{keyword}"' for keyword in keywords)
+
+
+def plan_searches(searches, max_keywords_per_query=MAX_KEYWORDS_PER_QUERY):
+    """Merge searches into fewer queries; each planned search lists the original searches it covers"""
+    # Drop exact duplicates, keeping the configured order
+    pairs = []
+    seen = set()
+    for search in searches:
+        key = (_normalize(search["keywords"]), _normalize(search["location"]))
+        if key not in seen:
+            seen.add(key)
+            pairs.append(search)
+
+    # Absorb locations already covered by a broader location searched for the same keyword
+    searched = {(_normalize(search["keywords"]), _normalize(search["location"])) for search in pairs}
+    covered_by = {}
+    for search in pairs:
+        for ancestor in _ancestors(search["location"]):
+            # Keep the broadest match, since narrower ancestors are absorbed themselves
+            if (_normalize(search["keywords"]), _normalize(ancestor)) in searched:
+                covered_by[id(search)] = ancestor
+
+    # Group the remaining keywords by location, in first-seen order
+    groups = {}
+    for search in pairs:
+        if id(search) in covered_by:
+            continue
+        group = groups.setdefault(_normalize(search["location"]), {"location": search["location"], "searches": []})
+        group["searches"].append(search)
+
+    plan = []
+    for group in groups.values():
+        group_searches = group["searches"]
+        for start in range(0, len(group_searches), max_keywords_per_query):
+            chunk = group_searches[start:start + max_keywords_per_query]
+            keywords = [search["keywords"] for search in chunk]
+            chunk_keys = {_normalize(keyword) for keyword in keywords}
+            covers = [dict(search) for search in chunk]
+            # Searches absorbed by this broader location count towards it
+            covers.extend(dict(search) for search in pairs
+                          if id(search) in covered_by
+                          and _normalize(covered_by[id(search)]) == _normalize(group["location"])
+                          and _normalize(search["keywords"]) in chunk_keys)
+            plan.append({"keywords": _keyword_query(keywords), "location": group["location"], "covers": covers})
+
+    logger.info(f"Search plan: {len(pairs)} searches merged into {len(plan)} queries")
+    return plan
+
+
+def result_pages(search):
+    """Result pages to read for a planned search: one for each configured search it covers"""
+    return max(1, len(search.get("covers", [])))
+
+
+def allocate_budget(total, plan, weights=None):
+    """Split `total` applications across planned searches in proportion to the searches each covers,
+    times the per-search `weights` if given"""
+    if not plan:
+        return []
+    weights = [result_pages(search) * (weights[i] if weights else 1) for i, search in enumerate(plan)]
+    weight_sum = sum(weights) or 1
+    shares = [total * weight / weight_sum for weight in weights]
+    budgets = [int(share) for share in shares]
+    # Hand out the rounding remainder to the largest fractional shares (earlier searches win ties)
+    remainder = total - sum(budgets)
+    order = sorted(range(len(plan)), key=lambda i: (budgets[i] - shares[i], i))
+    for i in order[:remainder]:
+        budgets[i] += 1
+    return budgets
+
+
+def dedupe_postings(postings, seen_job_ids):
+    """Return postings whose job ID has not been seen yet, once each; callers mark the ones they attempt as seen"""
+    fresh = []
+    listed = set()
+    for posting in postings:
+        job_id = posting.get("job_id")
+        if job_id and (job_id in seen_job_ids or job_id in listed):
+            continue
+        if job_id:
+            listed.add(job_id)
+        fresh.append(posting)
+    return fresh
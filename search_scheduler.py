@@ -0,0 +1,124 @@
+"""Yield-aware scheduling of searches under a global application budget.
+
+Keeps per-search history across sessions (postings found, Easy Apply rate,
+success rate, seconds spent) in a JSON file, estimates each search's expected
+successful applications per minute, and hands the global budget out in that
+order and proportion. Searches without history start from a neutral prior so
+they still get tried; searches that keep reporting no postings fade out.
+"""
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+
+from search_planner import allocate_budget, result_pages
+
+logger = logging.getLogger()
+
+STAT_FIELDS = ("runs", "runs_with_postings", "postings_found", "attempted", "easy_apply", "applied", "seconds")
+
+# Pseudo-observations that stand in for history a search does not have yet
+PRIOR_RUNS = 2
+PRIOR_POSTINGS_RATE = 0.8  # Share of runs that find any postings
+PRIOR_ATTEMPTS = 3
+PRIOR_EASY_APPLY_RATE = 0.7
+PRIOR_SUCCESS_RATE = 0.5  # Successful applications per Easy Apply attempt
+PRIOR_SECONDS_PER_ATTEMPT = 90
+
+
+def search_key(search):
+    return f"{' '.join(search['keywords'].split()).casefold()}|{' '.join(search['location'].split()).casefold()}"
+
+
+class SearchScheduler:
+    """Allocate a global application budget across searches by expected applications per minute"""
+
+    def __init__(self, path="search_stats.json"):
+        self.path = path
+        self.stats = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        if self.path and os.path.exists(self.path):
+            try:
+                with open(self.path) as f:
+                    self.stats = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Could not read search statistics from {self.path}: {str(e)}")
+
+    def save(self):
+        if not self.path:
+            return
+        try:
+            with open(self.path, "w") as f:
+                json.dump(self.stats, f, indent=2, sort_keys=True)
+        except OSError as e:
+            logger.warning(f"Could not save search statistics to {self.path}: {str(e)}")
+
+    def _history(self, search):
+        return self.stats.get(search_key(search), {})
+
+    def expected_rate(self, search):
+        """Expected successful applications per minute spent on this search"""
+        history = self._history(search)
+        runs = history.get("runs", 0)
+        attempted = history.get("attempted", 0)
+
+        postings_rate = ((history.get("runs_with_postings", 0) + PRIOR_POSTINGS_RATE * PRIOR_RUNS)
+                         / (runs + PRIOR_RUNS))
+        easy_apply_rate = ((history.get("easy_apply", 0) + PRIOR_EASY_APPLY_RATE * PRIOR_ATTEMPTS)
+                           / (attempted + PRIOR_ATTEMPTS))
+        success_rate = ((history.get("applied", 0) + PRIOR_SUCCESS_RATE * PRIOR_EASY_APPLY_RATE * PRIOR_ATTEMPTS)
+                        / (history.get("easy_apply", 0) + PRIOR_EASY_APPLY_RATE * PRIOR_ATTEMPTS))
+        seconds_per_attempt = ((history.get("seconds", 0) + PRIOR_SECONDS_PER_ATTEMPT * PRIOR_ATTEMPTS)
+                               / (attempted + PRIOR_ATTEMPTS))
+        return postings_rate * easy_apply_rate * success_rate * 60 / seconds_per_attempt
+
+    def schedule(self, searches, total_budget):
+        """Return [(search, budget), ...] ordered by expected yield, budgets summing to `total_budget`"""
+        if not searches:
+            return []
+        rates = [self.expected_rate(search) for search in searches]
+        # Merged searches that cover several configured searches weigh proportionally more
+        budgets = allocate_budget(total_budget, searches, rates)
+
+        order = sorted(range(len(searches)), key=lambda i: -rates[i] * result_pages(searches[i]))
+        for i in order:
+            logger.info(f"Scheduled '{searches[i]['keywords']}' in '{searches[i]['location']}': "
+                        f"{budgets[i]} applications, {self.expected_rate(searches[i]):.2f} expected per minute")
+        return [(searches[i], budgets[i]) for i in order]
+
+    def record(self, search, run_stats, seconds, new_run=True):
+        """Add the outcome of one search run to its history and persist it. With `new_run` False the
+        outcome (say one queued application) is added to the search's history without counting a run."""
+        with self._lock:
+            # Another stage or process may have recorded outcomes since this history was read
+            self._load()
+            history = self.stats.setdefault(search_key(search), {field: 0 for field in STAT_FIELDS})
+            if new_run:
+                history["runs"] += 1
+                history["runs_with_postings"] += 1 if run_stats.get("postings_found") else 0
+            for field in ("postings_found", "attempted", "easy_apply", "applied"):
+                history[field] += run_stats.get(field, 0)
+            history["seconds"] = round(history["seconds"] + seconds, 1)
+            history["last_run"] = datetime.now().isoformat(timespec="seconds")
+            self.save()
+
+    def report(self):
+        """Per-search summary rows for printing"""
+        rows = []
+        for key, history in sorted(self.stats.items()):
+            attempted = history.get("attempted", 0)
+            easy_apply = history.get("easy_apply", 0)
+            applied = history.get("applied", 0)
+            rows.append({
+                "search": key,
+                "runs": history.get("runs", 0),
+                "postings_found": history.get("postings_found", 0),
+                "easy_apply_rate": round(easy_apply / attempted, 2) if attempted else None,
+                "success_rate": round(applied / easy_apply, 2) if easy_apply else None,
+                "seconds_per_application": round(history.get("seconds", 0) / applied, 1) if applied else None
+            })
+        return rows
@@ -0,0 +1,75 @@
+"""Settings shared by the automation, the pipeline and the command line.
+
+Kept free of Selenium and the other heavy imports so the CLI can plan and
+report without paying for them. The constants are defaults; config.json
+overrides the ones it defines (credentials, searches, application limit,
+delay between applications).
+"""
+import json
+import logging
+
+from search_planner import expand_searches
+
+logger = logging.getLogger()
+
+CONFIG_FILE = "config.json"
+LOG_FILE = "linkedin_automation.log"
+MAX_APPLICATIONS = 3  # Applications per search when config.json sets no application_limit
+DEFAULT_JOB_SEARCHES = [  # Job searches to perform when config.json lists no keywords and locations
+    {"keywords": "Software Engineer", "location": "Remote"},
+    {"keywords": "Python Developer", "location": "New York"},
+    {"keywords": "Python Developer", "location": "Remote"}
+]
+DELAY_BETWEEN_APPLICATIONS = (5, 8)  # Random wait range between applications in seconds
+SEARCH_STATS_FILE = "search_stats.json"  # Per-search yield history used to schedule searches
+WAIT_TIMEOUTS = {  # Configured timeouts in seconds, used until enough waits have been observed
+    "page_load": 30,
+    "login_form": 15,
+    "login_success": 25,
+    "search_results": 10,
+    "job_cards": 10,
+    "job_details": 10,
+    "application_form": 10
+}
+TIMEOUT_PROFILE_FILE = "timeout_profile.json"  # Observed wait durations the timeouts are learned from
+JOB_CACHE_FILE = "job_cache.sqlite3"  # Parsed job details shared across searches and sessions
+JOB_CACHE_TTL_HOURS = 72  # Details older than this are fetched again
+JOB_CACHE_MAX_ENTRIES = 5000  # Oldest entries are evicted beyond this
+QUEUE_FILE = "work_queue.sqlite3"  # Durable queue between the discovery and apply stages
+
+
+def configure_logging(level=logging.INFO, log_file=LOG_FILE):
+    """Log to the console and, if `log_file` is set, to the session log file"""
+    handlers = [logging.StreamHandler()]
+    if log_file:
+        handlers.append(logging.FileHandler(log_file))
+    logging.basicConfig(level=level, format='%(asctime)s - %(levelname)s - %(message)s', handlers=handlers)
+
+
+def load_config(path=CONFIG_FILE):
+    """Load settings from the JSON config file, or an empty dict if it is missing or invalid"""
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.warning(f"Could not read config from {path}: {str(e)}")
+        return {}
+
+
+def configured_searches(config):
+    """Every keyword in every location from config.json's job_preferences, or the default searches"""
+    preferences = config.get("job_preferences", {})
+    keywords = preferences.get("keywords") or []
+    locations = list(preferences.get("locations") or [])
+    if preferences.get("remote") and "Remote" not in locations:
+        locations.append("Remote")
+    if not keywords or not locations:
+        return list(DEFAULT_JOB_SEARCHES)
+    return expand_searches(keywords, locations)
+
+
+def application_limit(config, searches):
+    """Applications allowed in one session: config.json's application_limit, else a fixed number per search"""
+    return config.get("application_limit") or MAX_APPLICATIONS * len(searches)
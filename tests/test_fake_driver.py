@@ -0,0 +1,48 @@
+import os
+
+import pytest
+
+import Linkedinauto
+from fake_driver import FakeDriver, JavascriptException
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "fixtures")
+
+
+@pytest.fixture
+def pages():
+    pages = {}
+    for name in ("job_details.html", "easy_apply_form.html"):
+        with open(os.path.join(FIXTURE_DIR, name), encoding="utf-8") as f:
+            pages[name] = f.read()
+    return pages
+
+
+@pytest.fixture(autouse=True)
+def no_waits(monkeypatch, tmp_path):
+    monkeypatch.setattr(Linkedinauto, "WAIT_TIME_BETWEEN_ACTIONS", (0, 0))
+    monkeypatch.setattr(Linkedinauto.time, "sleep", lambda seconds: None)
+    # Screenshots go to a throwaway directory
+    monkeypatch.chdir(tmp_path)
+
+
+def test_check_easy_apply_round_trips(pages):
+    driver = FakeDriver(pages, start_page="job_details.html")
+    assert Linkedinauto.check_easy_apply(driver) is True
+    assert driver.command_counts == {"findElements": 1, "isElementDisplayed": 1}
+
+
+def test_complete_application_round_trips(pages):
+    driver = FakeDriver(pages, start_page="easy_apply_form.html")
+    assert Linkedinauto.complete_application(driver, 0) is True
+    assert driver.command_counts == {
+        "findElements": 31, "findChildElements": 1, "isElementDisplayed": 41, "isElementSelected": 8,
+        "getElementAttribute": 25, "getElementText": 10, "sendKeysToElement": 4, "clickElement": 8,
+        "executeScript": 7, "screenshot": 4
+    }
+    assert driver.command_total == 139
+
+
+def test_unknown_script_raises_like_webdriver(pages):
+    driver = FakeDriver(pages)
+    with pytest.raises(JavascriptException):
+        driver.execute_script("return navigator.userAgent")
@@ -0,0 +1,55 @@
+from search_planner import plan_searches, result_pages, allocate_budget, dedupe_postings
+
+
+def test_broader_location_absorbs_narrower_one():
+    plan = plan_searches([
+        {"keywords": "Python Developer", "location": "New York"},
+        {"keywords": "Python Developer", "location": "United States"},
+    ])
+    assert len(plan) == 1
+    assert plan[0]["location"] == "United States"
+    assert plan[0]["keywords"] == "Python Developer"
+    assert {search["location"] for search in plan[0]["covers"]} == {"New York", "United States"}
+    assert result_pages(plan[0]) == 2
+
+
+def test_absorption_follows_ancestor_chain_and_keeps_other_keywords():
+    plan = plan_searches([
+        {"keywords": "Python Developer", "location": "San Francisco"},
+        {"keywords": "Python Developer", "location": "United States"},
+        {"keywords": "Data Engineer", "location": "San Francisco"},
+    ])
+    by_location = {search["location"]: search for search in plan}
+    assert set(by_location) == {"San Francisco", "United States"}
+    assert by_location["San Francisco"]["keywords"] == "Data Engineer"
+    assert len(by_location["United States"]["covers"]) == 2
+
+
+def test_keywords_sharing_a_location_are_or_combined():
+    plan = plan_searches([
+        {"keywords": "Python Developer", "location": "Texas"},
+        {"keywords": "backend  developer", "location": "texas"},
+        {"keywords": "Backend Developer", "location": "Texas"},
+    ])
+    assert len(plan) == 1
+    assert plan[0]["keywords"] == '"Python Developer" OR "backend  developer"'
+    assert result_pages(plan[0]) == 2
+
+
+def test_budget_follows_coverage():
+    plan = [{"covers": [1, 2, 3]}, {"covers": [1]}]
+    assert allocate_budget(8, plan) == [6, 2]
+    assert sum(allocate_budget(7, plan)) == 7
+
+
+def test_dedupe_leaves_marking_seen_to_the_caller():
+    seen = {"1"}
+    postings = [{"job_id": "1"}, {"job_id": "2"}, {"job_id": "2"}, {"job_id": "3"}]
+    assert [posting["job_id"] for posting in dedupe_postings(postings, seen)] == ["2", "3"]
+    assert seen == {"1"}
+
+
+def test_budget_weights_multiply_coverage():
+    plan = [{"covers": [1, 2]}, {"covers": [1]}, {"covers": []}]
+    assert allocate_budget(10, plan, [1.0, 4.0, 0.0]) == [3, 7, 0]
+    assert allocate_budget(2, plan, [0.0, 0.0, 0.0]) == [1, 1, 0]
@@ -0,0 +1,28 @@
+from search_scheduler import SearchScheduler, search_key
+
+SEARCH = {"keywords": "Python Developer", "location": "Remote"}
+
+
+def test_record_merges_outcomes_from_other_stages(tmp_path):
+    path = str(tmp_path / "search_stats.json")
+    discovery = SearchScheduler(path)
+    worker = SearchScheduler(path)
+    discovery.record(SEARCH, {"postings_found": 25}, 4.0)
+    worker.record(SEARCH, {"attempted": 1, "easy_apply": 1, "applied": 1}, 60.0, new_run=False)
+
+    history = SearchScheduler(path).stats[search_key(SEARCH)]
+    assert history["runs"] == 1
+    assert history["postings_found"] == 25
+    assert history["applied"] == 1
+    assert history["seconds"] == 64.0
+
+
+def test_schedule_prefers_searches_that_applied(tmp_path):
+    scheduler = SearchScheduler(str(tmp_path / "search_stats.json"))
+    other = {"keywords": "Java Developer", "location": "Remote"}
+    scheduler.record(SEARCH, {"postings_found": 25, "attempted": 5, "easy_apply": 5, "applied": 5}, 300.0)
+    scheduler.record(other, {"postings_found": 25, "attempted": 5, "easy_apply": 1, "applied": 0}, 300.0)
+    schedule = scheduler.schedule([other, SEARCH], 10)
+    assert schedule[0][0] is SEARCH
+    assert schedule[0][1] > schedule[1][1]
+    assert sum(budget for _, budget in schedule) == 10
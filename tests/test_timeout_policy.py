@@ -0,0 +1,65 @@
+import json
+
+from timeout_policy import TimeoutPolicy, percentile, MIN_SAMPLES, FLOOR_SECONDS, CEILING_FACTOR, BACKOFF_AFTER
+
+
+def test_percentile_is_nearest_rank():
+    values = list(range(1, 101))
+    assert percentile(values, 0.95) == 95
+    assert percentile(values, 0.5) == 50
+    assert percentile([3.0], 0.95) == 3.0
+
+
+def test_configured_timeout_until_enough_samples():
+    policy = TimeoutPolicy({"job_details": 10})
+    for _ in range(MIN_SAMPLES - 1):
+        policy.record("job_details", 1.0)
+    assert policy.timeout("job_details") == 10
+    policy.record("job_details", 1.0)
+    assert policy.timeout("job_details") == 2.5
+
+
+def test_learned_timeout_is_clamped_to_floor_and_ceiling():
+    policy = TimeoutPolicy({"fast": 10, "slow": 10})
+    for _ in range(MIN_SAMPLES):
+        policy.record("fast", 0.1)
+        policy.record("slow", 60.0)
+    assert policy.timeout("fast") == FLOOR_SECONDS
+    assert policy.timeout("slow") == 10 * CEILING_FACTOR
+
+
+def test_repeated_timeouts_back_off_until_a_success():
+    policy = TimeoutPolicy({"job_cards": 10})
+    for _ in range(20):
+        policy.record("job_cards", 1.0)
+    learned = policy.timeout("job_cards")
+    for _ in range(BACKOFF_AFTER):
+        policy.record_timeout("job_cards", learned)
+    assert policy.timeout("job_cards") == 10 * CEILING_FACTOR
+    policy.record("job_cards", 1.0)
+    # Back to the learned timeout, raised by the two waits that ran out
+    assert learned < policy.timeout("job_cards") < 10 * CEILING_FACTOR
+
+
+def test_timeouts_count_as_samples_of_the_time_waited():
+    policy = TimeoutPolicy({"search_results": 10})
+    for _ in range(18):
+        policy.record("search_results", 1.0)
+    for _ in range(2):
+        policy.record_timeout("search_results", 2.5)
+        policy.record("search_results", 1.0)
+    assert policy.timeout("search_results") == 4.8
+
+
+def test_profile_round_trip(tmp_path):
+    path = tmp_path / "timeout_profile.json"
+    policy = TimeoutPolicy({"page_load": 30}, str(path))
+    policy.record("page_load", 2.0)
+    policy.record_timeout("page_load", 30.0)
+    policy.save()
+    assert json.loads(path.read_text())["page_load"]["consecutive_timeouts"] == 1
+
+    loaded = TimeoutPolicy({"page_load": 30}, str(path))
+    assert loaded.samples["page_load"] == [2.0, 30.0]
+    assert loaded.timeouts["page_load"] == 1
+    assert loaded.consecutive_timeouts["page_load"] == 1
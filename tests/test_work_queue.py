@@ -0,0 +1,69 @@
+import pytest
+
+from work_queue import WorkQueue
+
+
+@pytest.fixture
+def queue_path(tmp_path):
+    return str(tmp_path / "work_queue.sqlite3")
+
+
+def test_put_is_idempotent_by_job_id(queue_path):
+    queue = WorkQueue(queue_path)
+    assert queue.put("1", {"title": "first"})
+    assert not queue.put("1", {"title": "again"})
+    job_id, payload, attempt = queue.lease()
+    queue.ack(job_id, True)
+    assert not queue.put("1", {"title": "after done"})
+    assert payload == {"title": "first"}
+    assert queue.counts() == {"pending": 0, "leased": 0, "done": 1, "failed": 0}
+    queue.close()
+
+
+def test_expired_lease_is_handed_out_again(queue_path):
+    producer = WorkQueue(queue_path)
+    producer.put("1", {})
+    crashed = WorkQueue(queue_path, lease_seconds=-1)
+    assert crashed.lease() == ("1", {}, 1)
+    # An expired lease is waiting again, not in progress
+    assert crashed.in_flight_count() == 0
+    assert crashed.pending_count() == 1
+
+    worker = WorkQueue(queue_path)
+    assert worker.lease() == ("1", {}, 2)
+    assert worker.in_flight_count() == 1
+    assert worker.lease() is None
+    for queue in (producer, crashed, worker):
+        queue.close()
+
+
+def test_job_fails_after_max_attempts(queue_path):
+    queue = WorkQueue(queue_path, max_attempts=2)
+    queue.put("1", {})
+    for attempt in (1, 2):
+        assert queue.lease() == ("1", {}, attempt)
+        queue.release("1")
+    assert queue.lease() is None
+    assert queue.counts()["failed"] == 1
+    queue.close()
+
+
+def test_expired_leases_fail_after_max_attempts(queue_path):
+    queue = WorkQueue(queue_path, lease_seconds=-1, max_attempts=2)
+    queue.put("1", {})
+    queue.lease()
+    queue.lease()
+    assert queue.lease() is None
+    assert queue.counts()["failed"] == 1
+    queue.close()
+
+
+def test_backpressure_and_priority(queue_path):
+    queue = WorkQueue(queue_path, max_pending=2)
+    queue.put("low", {}, priority=0.1)
+    assert queue.has_room()
+    queue.put("high", {}, priority=0.9)
+    assert not queue.has_room()
+    assert queue.lease()[0] == "high"
+    assert queue.has_room()
+    queue.close()
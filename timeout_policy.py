@@ -0,0 +1,131 @@
+"""Wait timeouts learned from how long each named wait takes to succeed.
+
+Every named wait records its duration when it succeeds. Once a wait has
+enough samples, its timeout becomes a high percentile of those durations
+plus a margin, clamped between a floor and a ceiling; until then the
+configured timeout is used. A wait that times out is recorded as a sample
+of the time it waited (the real duration was at least that long), so the
+learned timeout grows once more than a few percent of waits run out, and
+after a few timeouts in a row the wait falls back to the ceiling until it
+succeeds again. The profile is saved between runs.
+"""
+import json
+import logging
+import os
+import threading
+
+logger = logging.getLogger()
+
+PERCENTILE = 0.95
+MARGIN_FACTOR = 1.5  # Learned timeout = percentile duration * factor + seconds
+MARGIN_SECONDS = 1.0
+FLOOR_SECONDS = 2.0
+CEILING_FACTOR = 2.0  # Learned timeouts may grow up to this multiple of the configured timeout
+MIN_SAMPLES = 5
+MAX_SAMPLES = 200  # Only the most recent durations are kept per wait
+BACKOFF_AFTER = 2  # Consecutive timeouts after which a wait uses the ceiling until it succeeds
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of a non-empty list"""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, int(round(fraction * len(ordered))) - 1))]
+
+
+class TimeoutPolicy:
+    """Per-wait timeouts derived from observed success durations"""
+
+    def __init__(self, configured, path=None):
+        """`configured` maps wait names to their fixed timeouts in seconds"""
+        self.configured = dict(configured)
+        self.path = path
+        self.samples = {}
+        self.timeouts = {}
+        self.consecutive_timeouts = {}
+        self._lock = threading.Lock()
+        if path:
+            self.load(path)
+
+    def load(self, path):
+        """Load a saved profile and use `path` for saving from now on"""
+        self.path = path
+        if not os.path.exists(path):
+            return
+        try:
+            with open(path) as f:
+                profile = json.load(f)
+            for name, entry in profile.items():
+                self.samples[name] = [float(value) for value in entry.get("samples", [])][-MAX_SAMPLES:]
+                self.timeouts[name] = int(entry.get("timeouts", 0))
+                self.consecutive_timeouts[name] = int(entry.get("consecutive_timeouts", 0))
+            logger.info(f"Loaded timeout profile for {len(profile)} waits from {path}")
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning(f"Could not read timeout profile from {path}: {str(e)}")
+
+    def save(self):
+        if not self.path:
+            return
+        with self._lock:
+            profile = {name: {"samples": [round(value, 3) for value in self.samples.get(name, [])],
+                              "timeouts": self.timeouts.get(name, 0),
+                              "consecutive_timeouts": self.consecutive_timeouts.get(name, 0)}
+                       for name in set(self.samples) | set(self.timeouts)}
+        try:
+            with open(self.path, "w") as f:
+                json.dump(profile, f, indent=2, sort_keys=True)
+        except OSError as e:
+            logger.warning(f"Could not save timeout profile to {self.path}: {str(e)}")
+
+    def configured_timeout(self, name):
+        """The fixed timeout configured for the named wait"""
+        return self.configured.get(name, 10)
+
+    def timeout(self, name):
+        """Timeout in seconds to use for the named wait"""
+        configured = self.configured_timeout(name)
+        ceiling = configured * CEILING_FACTOR
+        with self._lock:
+            samples = list(self.samples.get(name, []))
+            backing_off = self.consecutive_timeouts.get(name, 0) >= BACKOFF_AFTER
+        if backing_off:
+            return ceiling
+        if len(samples) < MIN_SAMPLES:
+            return configured
+        learned = percentile(samples, PERCENTILE) * MARGIN_FACTOR + MARGIN_SECONDS
+        return round(min(max(learned, FLOOR_SECONDS), ceiling), 1)
+
+    def _add_sample(self, name, seconds):
+        samples = self.samples.setdefault(name, [])
+        samples.append(seconds)
+        del samples[:-MAX_SAMPLES]
+
+    def record(self, name, seconds):
+        """Record how long a successful wait took"""
+        with self._lock:
+            self._add_sample(name, seconds)
+            self.consecutive_timeouts[name] = 0
+
+    def record_timeout(self, name, seconds):
+        """Record a wait that gave up after `seconds`, as a lower bound on how long it takes"""
+        with self._lock:
+            self._add_sample(name, seconds)
+            self.timeouts[name] = self.timeouts.get(name, 0) + 1
+            self.consecutive_timeouts[name] = self.consecutive_timeouts.get(name, 0) + 1
+
+    def report(self):
+        """Configured vs used timeout per wait, with the gap in seconds"""
+        rows = []
+        for name in sorted(set(self.configured) | set(self.samples)):
+            configured = self.configured_timeout(name)
+            used = self.timeout(name)
+            samples = self.samples.get(name, [])
+            rows.append({
+                "name": name,
+                "configured": configured,
+                "used": used,
+                "gap": round(configured - used, 1),
+                "samples": len(samples),
+                "p95": round(percentile(samples, PERCENTILE), 2) if samples else None,
+                "timeouts": self.timeouts.get(name, 0)
+            })
+        return rows
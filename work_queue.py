@@ -0,0 +1,140 @@
+"""Durable local work queue between the discovery and apply stages.
+
+Jobs are rows in a SQLite file keyed by job ID, so enqueueing a job that is
+already queued, in progress or finished is a no-op. Workers lease a job for
+a limited time; a job whose lease runs out (say its worker crashed) is handed
+out again, giving at-least-once delivery, and is given up after a number of
+attempts. Producers check `has_room` so discovery cannot run arbitrarily far
+ahead of applying. Each stage opens its own `WorkQueue` on the same file, in
+the same process or another one.
+"""
+import json
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+
+logger = logging.getLogger()
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS work_queue (
+    job_id TEXT PRIMARY KEY,
+    payload TEXT NOT NULL,
+    priority REAL NOT NULL DEFAULT 0,
+    status TEXT NOT NULL DEFAULT 'pending',  -- pending, leased, done, failed
+    attempts INTEGER NOT NULL DEFAULT 0,
+    leased_by TEXT,
+    lease_until REAL,
+    applied INTEGER,
+    enqueued_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+)
+"""
+INDEX = "CREATE INDEX IF NOT EXISTS work_queue_ready ON work_queue (status, priority DESC, enqueued_at)"
+
+
+class WorkQueue:
+    """SQLite-backed job queue with leases, idempotent by job ID"""
+
+    def __init__(self, path="work_queue.sqlite3", lease_seconds=600, max_pending=50, max_attempts=3):
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self.max_pending = max_pending
+        self.max_attempts = max_attempts
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{threading.get_ident()}"
+        # Autocommit mode so each operation controls its own (immediate) transaction
+        self._connection = sqlite3.connect(path, timeout=30, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(SCHEMA)
+        self._connection.execute(INDEX)
+
+    def put(self, job_id, payload, priority=0):
+        """Enqueue a job unless it has been enqueued before; returns True if it was added"""
+        now = time.time()
+        cursor = self._connection.execute(
+            "INSERT OR IGNORE INTO work_queue (job_id, payload, priority, enqueued_at, updated_at) VALUES (?, ?, ?, ?, ?)",
+            (job_id, json.dumps(payload), priority, now, now))
+        return cursor.rowcount == 1
+
+    def pending_count(self):
+        """Jobs waiting for a worker, including ones whose lease has expired"""
+        return self._connection.execute(
+            "SELECT COUNT(*) FROM work_queue WHERE status = 'pending' OR (status = 'leased' AND lease_until < ?)",
+            (time.time(),)).fetchone()[0]
+
+    def in_flight_count(self):
+        """Jobs leased to a worker whose lease has not run out yet"""
+        return self._connection.execute(
+            "SELECT COUNT(*) FROM work_queue WHERE status = 'leased' AND lease_until >= ?",
+            (time.time(),)).fetchone()[0]
+
+    def has_room(self):
+        """Backpressure: False while `max_pending` jobs are already waiting"""
+        return self.pending_count() < self.max_pending
+
+    def lease(self):
+        """Take the highest-priority ready job as (job_id, payload, attempt), or None if there is none"""
+        now = time.time()
+        self._connection.execute("BEGIN IMMEDIATE")
+        try:
+            # Jobs whose lease ran out too often are given up rather than retried forever
+            self._connection.execute(
+                "UPDATE work_queue SET status = 'failed', updated_at = ? "
+                "WHERE status = 'leased' AND lease_until < ? AND attempts >= ?",
+                (now, now, self.max_attempts))
+            row = self._connection.execute(
+                "SELECT job_id, payload, attempts FROM work_queue "
+                "WHERE status = 'pending' OR (status = 'leased' AND lease_until < ?) "
+                "ORDER BY priority DESC, enqueued_at LIMIT 1", (now,)).fetchone()
+            if row is None:
+                self._connection.execute("COMMIT")
+                return None
+            job_id, payload, attempts = row
+            self._connection.execute(
+                "UPDATE work_queue SET status = 'leased', attempts = attempts + 1, leased_by = ?, lease_until = ?, "
+                "updated_at = ? WHERE job_id = ?",
+                (self.worker_id, now + self.lease_seconds, now, job_id))
+            self._connection.execute("COMMIT")
+        except Exception:
+            self._connection.execute("ROLLBACK")
+            raise
+        if attempts:
+            logger.info(f"Job {job_id} handed out again (attempt {attempts + 1})")
+        return job_id, json.loads(payload), attempts + 1
+
+    def ack(self, job_id, applied):
+        """Mark a leased job as finished, whether or not the application went through"""
+        self._connection.execute(
+            "UPDATE work_queue SET status = 'done', applied = ?, lease_until = NULL, updated_at = ? WHERE job_id = ?",
+            (int(bool(applied)), time.time(), job_id))
+
+    def release(self, job_id):
+        """Return a leased job after an error; it is retried until `max_attempts` is reached"""
+        self._connection.execute(
+            "UPDATE work_queue SET status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END, "
+            "lease_until = NULL, updated_at = ? WHERE job_id = ?",
+            (self.max_attempts, time.time(), job_id))
+
+    def peek(self, limit=10):
+        """The next jobs a worker would lease, as [(job_id, payload), ...], without leasing them"""
+        rows = self._connection.execute(
+            "SELECT job_id, payload FROM work_queue "
+            "WHERE status = 'pending' OR (status = 'leased' AND lease_until < ?) "
+            "ORDER BY priority DESC, enqueued_at LIMIT ?", (time.time(), limit)).fetchall()
+        return [(job_id, json.loads(payload)) for job_id, payload in rows]
+
+    def applied_count(self, since=0):
+        """Jobs applied to, optionally only those finished after the `since` timestamp"""
+        return self._connection.execute("SELECT COUNT(*) FROM work_queue WHERE applied = 1 AND updated_at >= ?",
+                                        (since,)).fetchone()[0]
+
+    def counts(self):
+        """Number of jobs per status"""
+        counts = {"pending": 0, "leased": 0, "done": 0, "failed": 0}
+        counts.update(self._connection.execute("SELECT status, COUNT(*) FROM work_queue GROUP BY status").fetchall())
+        return counts
+
+    def close(self):
+        self._connection.close()